@@ -2,6 +2,9 @@
 
 from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QVariant, 
                           QMimeData, QByteArray, QDataStream, QIODevice)
+from PyQt6.QtGui import QPixmap
+import base64
+from collections import Counter
 
 class AlbumModel(QAbstractTableModel):
     """
@@ -29,6 +32,11 @@ class AlbumModel(QAbstractTableModel):
         self.album_data = []
         # Flag to track if data has been changed (similar to main window's dataChanged)
         self.is_modified = False
+        # Decoded cover pixmaps keyed by their base64 string, so a cover is
+        # decoded once and follows its row through any reordering
+        self._cover_pixmaps = {}
+        # Album names in the list, counted so duplicates survive a removal
+        self.album_names = Counter()
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.album_data)
@@ -70,9 +78,32 @@ class AlbumModel(QAbstractTableModel):
                 return self.album_data[row].get("album_id", "")
             elif column == self.COVER_IMAGE:
                 return self.album_data[row].get("cover_image", None)
+
+        elif role == Qt.ItemDataRole.DecorationRole and column == self.COVER_IMAGE:
+            return self.cover_pixmap(row)
         
         return QVariant()
+
+    def cover_pixmap(self, row):
+        """Return the decoded cover of a row as a QPixmap, or None if it has none."""
+        base64_image = self.album_data[row].get("cover_image")
+        if not base64_image:
+            return None
+        pixmap = self._cover_pixmaps.get(base64_image)
+        if pixmap is None:
+            pixmap = QPixmap()
+            try:
+                pixmap.loadFromData(base64.b64decode(base64_image))
+            except ValueError:
+                pass  # Leave the pixmap null; it's drawn as "No Image"
+            self._cover_pixmaps[base64_image] = pixmap
+        return pixmap
     
+    def _evict_cover(self, base64_image):
+        """Forget the decoded pixmap of a cover that is no longer shown."""
+        if base64_image:
+            self._cover_pixmaps.pop(base64_image, None)
+
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
         if not index.isValid():
             return False
@@ -226,6 +257,8 @@ class AlbumModel(QAbstractTableModel):
         """Clear all album data."""
         self.beginResetModel()
         self.album_data = []
+        self._cover_pixmaps.clear()
+        self.album_names.clear()
         self.endResetModel()
         self.is_modified = False
         return True
@@ -235,9 +268,16 @@ class AlbumModel(QAbstractTableModel):
         was_modified = self.is_modified  # Save current modified state
         self.beginResetModel()
         self.album_data = data
+        self._cover_pixmaps.clear()
+        self.album_names = Counter(album.get("album", "") for album in data)
         self.endResetModel()
         self.is_modified = was_modified
     
+    def row_snapshot(self, row):
+        """Return (artist, album, album_id) for a row straight from the backing list."""
+        album = self.album_data[row]
+        return album.get("artist", ""), album.get("album", ""), album.get("album_id", "")
+
     def get_album_data(self):
         """Get the album data as a list of dictionaries."""
         # Update ranks and points based on current order
@@ -250,15 +290,39 @@ class AlbumModel(QAbstractTableModel):
         """Add a new album to the model."""
         self.beginInsertRows(QModelIndex(), len(self.album_data), len(self.album_data))
         self.album_data.append(album_data)
+        self.album_names[album_data.get("album", "")] += 1
         self.endInsertRows()
         self.is_modified = True
         return True
     
+    def set_cover_image(self, album, base64_image, image_format):
+        """
+        Set the cover of an album dict and refresh its cell if it is still listed.
+        Returns True if the album was listed and the model is now modified.
+        """
+        # Drop the decoded pixmap of the cover being replaced
+        self._evict_cover(album.get("cover_image"))
+        album["cover_image"] = base64_image
+        album["cover_image_format"] = image_format
+        # Look the album up by identity, since rows may have moved meanwhile
+        for row, listed in enumerate(self.album_data):
+            if listed is album:
+                self.is_modified = True
+                index = self.index(row, self.COVER_IMAGE)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+                return True
+        return False
+
     def remove_album(self, row):
         """Remove an album from the model."""
         if 0 <= row < len(self.album_data):
             self.beginRemoveRows(QModelIndex(), row, row)
-            del self.album_data[row]
+            album = self.album_data.pop(row)
+            self._evict_cover(album.get("cover_image"))
+            name = album.get("album", "")
+            self.album_names[name] -= 1
+            if self.album_names[name] <= 0:
+                del self.album_names[name]
             self.endRemoveRows()
             self.is_modified = True
             return True
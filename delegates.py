@@ -4,12 +4,11 @@ from PyQt6.QtWidgets import (
     QStyledItemDelegate, QComboBox, QCompleter, QStyle, QApplication,
     QWidget
 )
-from PyQt6.QtGui import QPalette, QColor, QPolygon, QImage, QPixmap
-from PyQt6.QtCore import Qt, QRectF, QRect, QPointF, QPoint
+from PyQt6.QtGui import QPalette, QColor, QPolygon, QPixmap
+from PyQt6.QtCore import Qt, QRectF, QRect, QPointF, QPoint, QStringListModel
 import logging
 import re
 from html import unescape
-import base64
 
 
 def strip_html_tags(text):
@@ -29,90 +28,104 @@ class CoverImageDelegate(QStyledItemDelegate):
     """
     Delegate for rendering cover images in the album table view.
     """
+    # Upper bound on cached scaled covers before the cache is dropped
+    MAX_SCALED_CACHE = 1024
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Scaled pixmaps keyed by (source cacheKey, width, height)
+        self._scaled_cache = {}
+
+    def scaled_cover(self, pixmap, size):
+        """Return pixmap scaled to fit size, scaling each cover once per cell size."""
+        key = (pixmap.cacheKey(), size.width(), size.height())
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            if len(self._scaled_cache) >= self.MAX_SCALED_CACHE:
+                self._scaled_cache.clear()
+            scaled = pixmap.scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._scaled_cache[key] = scaled
+        return scaled
         
     def paint(self, painter, option, index):
         if not painter:
             return
-            
-        base64_image = index.data(Qt.ItemDataRole.UserRole)
-        if base64_image:
-            try:
-                painter.save()
-                
-                # Get the cell rect
-                rect = option.rect
-                
-                # Draw the background
-                style = QApplication.style()
-                if style:
-                    style.drawPrimitive(
-                        QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, None
-                    )
-                else:
-                    # Fallback when style is None
-                    if option.state & QStyle.StateFlag.State_Selected:
-                        painter.fillRect(option.rect, option.palette.highlight())
-                    else:
-                        painter.fillRect(option.rect, option.palette.base())
-                
-                # Decode the base64 image
-                image_bytes = base64.b64decode(base64_image)
-                image = QImage.fromData(image_bytes)
-                pixmap = QPixmap.fromImage(image)
-                
-                # Scale the pixmap to fit the cell while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    rect.size(), 
-                    Qt.AspectRatioMode.KeepAspectRatio, 
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                # Center the pixmap in the cell
-                x = rect.x() + (rect.width() - scaled_pixmap.width()) // 2
-                y = rect.y() + (rect.height() - scaled_pixmap.height()) // 2
-                
-                # Draw the pixmap
-                painter.drawPixmap(x, y, scaled_pixmap)
-                painter.restore()
-            except Exception:
-                # Draw "No Image" placeholder
-                painter.save()
-                style = QApplication.style()
-                if style:
-                    style.drawPrimitive(
-                        QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, None
-                    )
-                else:
-                    # Fallback when style is None
-                    if option.state & QStyle.StateFlag.State_Selected:
-                        painter.fillRect(option.rect, option.palette.highlight())
-                    else:
-                        painter.fillRect(option.rect, option.palette.base())
-                
-                # Draw "No Image" placeholder
-                painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, "No Image")
-                painter.restore()
+
+        painter.save()
+
+        # Draw the background
+        style = QApplication.style()
+        if style:
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, None
+            )
         else:
-            # Draw "No Image" placeholder
-            painter.save()
-            style = QApplication.style()
-            if style:
-                style.drawPrimitive(
-                    QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, None
-                )
+            # Fallback when style is None
+            if option.state & QStyle.StateFlag.State_Selected:
+                painter.fillRect(option.rect, option.palette.highlight())
             else:
-                # Fallback when style is None
-                if option.state & QStyle.StateFlag.State_Selected:
-                    painter.fillRect(option.rect, option.palette.highlight())
-                else:
-                    painter.fillRect(option.rect, option.palette.base())
-            
+                painter.fillRect(option.rect, option.palette.base())
+
+        # The model decodes each cover once and hands out the cached pixmap
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            # Get the cell rect
+            rect = option.rect
+
+            # Scale the pixmap to fit the cell while maintaining aspect ratio
+            scaled_pixmap = self.scaled_cover(pixmap, rect.size())
+
+            # Center the pixmap in the cell
+            x = rect.x() + (rect.width() - scaled_pixmap.width()) // 2
+            y = rect.y() + (rect.height() - scaled_pixmap.height()) // 2
+
+            # Draw the pixmap
+            painter.drawPixmap(x, y, scaled_pixmap)
+        else:
+            # Draw "No Image" placeholder
             painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, "No Image")
-            painter.restore()
 
-class ComboBoxDelegate(QStyledItemDelegate):
+        painter.restore()
+
+class ItemListMixin:
+    """
+    Shared choice list for delegates with combo box editors.
+
+    The items are held in one QStringListModel that every editor and completer
+    reuses, plus a case-insensitive item -> row lookup, so opening an editor
+    doesn't copy the list and selecting the current value is a dict lookup.
+    """
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
+        if getattr(self, '_items_model', None) is None:
+            self._items_model = QStringListModel(self)
+        self._items_model.setStringList(items)
+        item_rows = {}
+        for row, item in enumerate(items):
+            item_rows.setdefault(item.casefold(), row)
+        self._item_rows = item_rows
+
+    def populate_editor(self, comboBox):
+        """Point a new combo box and its completer at the shared item model."""
+        comboBox.setModel(self._items_model)
+        completer = QCompleter(self._items_model, comboBox)
+        comboBox.setCompleter(completer)
+        return completer
+
+    def item_row(self, value):
+        """Return the row of value in the item list (case-insensitive), or -1."""
+        return self._item_rows.get(value.casefold(), -1)
+
+class ComboBoxDelegate(ItemListMixin, QStyledItemDelegate):
     """
     A delegate that provides a QComboBox editor for table cells.
     """
@@ -123,14 +136,12 @@ class ComboBoxDelegate(QStyledItemDelegate):
     def createEditor(self, parent, option, index):
         comboBox = QComboBox(parent)
         comboBox.setEditable(True)
-        comboBox.addItems(self.items)
         comboBox.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
 
         # Create the completer and set it to be case insensitive
-        completer = QCompleter(self.items, comboBox)
+        completer = self.populate_editor(comboBox)
         completer.setFilterMode(Qt.MatchFlag.MatchContains)
         completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        comboBox.setCompleter(completer)
 
         # Apply consistent styling to dropdown and completer
         popup = completer.popup()
@@ -209,8 +220,7 @@ class ComboBoxDelegate(QStyledItemDelegate):
             
         value = model.data(index, Qt.ItemDataRole.EditRole)
         if value:
-            idx = editor.findText(value, Qt.MatchFlag.MatchFixedString)
-            editor.setCurrentIndex(idx if idx >= 0 else -1)
+            editor.setCurrentIndex(self.item_row(value))
     def setModelData(self, editor, model, index):
         """Updates the model with the editor's current value."""
         if not isinstance(editor, QComboBox):
@@ -225,9 +235,6 @@ class ComboBoxDelegate(QStyledItemDelegate):
         current_value = model.data(index, Qt.ItemDataRole.EditRole)
         if new_value != current_value:
             model.setData(index, new_value, Qt.ItemDataRole.EditRole)
-        current_value = model.data(index, Qt.ItemDataRole.EditRole)
-        if new_value != current_value:
-            model.setData(index, new_value, Qt.ItemDataRole.EditRole)
 
     def updateEditorGeometry(self, editor, option, index):
         """Sets the editor's geometry to match cell dimensions."""
@@ -303,14 +310,6 @@ class SearchHighlightDelegate(QStyledItemDelegate):
                     else:
                         painter.fillRect(option.rect, option.palette.base())
 
-            # First check if this cell has a widget
-            from PyQt6.QtWidgets import QAbstractItemView
-            if isinstance(parent, QAbstractItemView):
-                widget = parent.indexWidget(index)
-                if widget:
-                    # If there's a widget, don't draw any text - let the widget handle it
-                    return  # No explicit restore here - the finally block will handle it
-
             # Get the cell text from the model data
             data = index.data(Qt.ItemDataRole.DisplayRole)
 
@@ -363,7 +362,7 @@ class SearchHighlightDelegate(QStyledItemDelegate):
         finally:
             painter.restore()
 
-class GenreSearchDelegate(QStyledItemDelegate):
+class GenreSearchDelegate(ItemListMixin, QStyledItemDelegate):
     """
     A delegate specifically for genre columns that highlights search matches.
     """
@@ -393,14 +392,12 @@ class GenreSearchDelegate(QStyledItemDelegate):
         """
         comboBox = QComboBox(parent)
         comboBox.setEditable(True)
-        comboBox.addItems(self.items)
         comboBox.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
 
         # Create the completer and set it to be case insensitive
-        completer = QCompleter(self.items, comboBox)
+        completer = self.populate_editor(comboBox)
         completer.setFilterMode(Qt.MatchFlag.MatchContains)
         completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        comboBox.setCompleter(completer)
         popup = completer.popup()
         if popup:
             popup.setStyleSheet("background-color: #2D2D30; color: white;")
@@ -423,8 +420,7 @@ class GenreSearchDelegate(QStyledItemDelegate):
         if not value:
             return
             
-        idx = editor.findText(value, Qt.MatchFlag.MatchFixedString)
-        editor.setCurrentIndex(idx if idx >= 0 else -1)
+        editor.setCurrentIndex(self.item_row(value))
 
     def setModelData(self, editor, model, index):
         """Updates the model with the editor's current value."""
@@ -1,13 +1,22 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QSize, QRect, QFile, QIODevice, QTextStream
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QSize, QRect, QFile, QIODevice, QTextStream, QUrl
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PyQt6.QtGui import QIcon, QColor, QPixmap, QCursor
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QApplication, QListWidgetItem, QScrollArea,
-                            QPushButton, QLineEdit, QTextEdit, QComboBox, QStyledItemDelegate, QStyle,
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QApplication, QScrollArea,
+                            QPushButton, QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QStyledItemDelegate, QStyle,
                             QGroupBox, QFormLayout, QFileDialog, QMessageBox, QCompleter, QListWidget, QTextBrowser, QWidget)
 import logging
 import os
 import requests
+from urllib.parse import urlencode
+from functools import partial
+from collections import Counter
 from datetime import datetime
 from workers import Worker
+from json_utils import json_loads
+
+# Options for every file picker: skip per-entry custom icon lookups and symlink
+# resolution, which stat each file and crawl on network or very large folders
+FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
 
 class EditableComboBox(QComboBox):
     """
@@ -363,7 +372,8 @@ class ManualAddAlbumDialog(QDialog):
         """Open file dialog to select an image file."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Cover Image", "", 
-            "Image Files (*.png *.jpg *.jpeg *.bmp *.webp)"
+            "Image Files (*.png *.jpg *.jpeg *.bmp *.webp)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         if file_path:
@@ -559,20 +569,25 @@ class ManualAddAlbumDialog(QDialog):
         super().accept()
 
 class LogViewerDialog(QDialog):
+    MAX_LOG_LINES = 5000  # Older lines are dropped once the viewer holds this many
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Live Log Viewer")
         self.resize(800, 600)
         layout = QVBoxLayout()
-        self.log_text_edit = QTextEdit(self)
+        # Plain text avoids a rich-text layout pass for every appended line
+        self.log_text_edit = QPlainTextEdit(self)
         self.log_text_edit.setReadOnly(True)
+        self.log_text_edit.setUndoRedoEnabled(False)
+        self.log_text_edit.setMaximumBlockCount(self.MAX_LOG_LINES)
         # Set dark background and light text
         self.log_text_edit.setStyleSheet("background-color: #2D2D30; color: white;")
         layout.addWidget(self.log_text_edit)
         self.setLayout(layout)
 
     def append_log(self, message):
-        self.log_text_edit.append(message)
+        self.log_text_edit.appendPlainText(message)
 
 
 class SubmitDialog(QDialog):
@@ -822,8 +837,7 @@ class GenreUpdateDialog(QDialog):
             added_layout = QVBoxLayout(added_group)
             
             added_list = QListWidget()
-            for genre in self.added_genres:
-                added_list.addItem(genre)
+            added_list.addItems(self.added_genres)
             added_list.setMaximumHeight(150)
             
             added_layout.addWidget(added_list)
@@ -835,8 +849,7 @@ class GenreUpdateDialog(QDialog):
             removed_layout = QVBoxLayout(removed_group)
             
             removed_list = QListWidget()
-            for genre in self.removed_genres:
-                removed_list.addItem(genre)
+            removed_list.addItems(self.removed_genres)
             removed_list.setMaximumHeight(150)
             
             removed_layout.addWidget(removed_list)
@@ -1010,6 +1023,8 @@ class SearchDialog(QDialog):
         self.artist_list.setItemDelegate(self.artist_delegate)
         self.artist_list.setIconSize(QSize(50, 50))
         self.artist_list.setUniformItemSizes(True)
+        self.artist_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.artist_list.setBatchSize(100)
         artist_column.addWidget(self.artist_list)
         
         # Albums column
@@ -1033,6 +1048,8 @@ class SearchDialog(QDialog):
         self.album_list.setItemDelegate(self.album_delegate)
         self.album_list.setIconSize(QSize(50, 50))
         self.album_list.setUniformItemSizes(True)
+        self.album_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.album_list.setBatchSize(100)
         album_column.addWidget(self.album_list)
         
         results_layout.addLayout(artist_column)
@@ -1055,8 +1072,14 @@ class SearchDialog(QDialog):
         # Image cache and active threads
         self.image_cache = {}
         self.active_threads = []
+
+        # Artist searches run on the event loop when a fresh token is at hand
+        self.network_manager = QNetworkAccessManager(self)
+        self.artist_search_reply = None
     
     def closeEvent(self, event):
+        if self.artist_search_reply is not None:
+            self.artist_search_reply.abort()
         for thread in self.active_threads:
             if thread.isRunning():
                 thread.wait(500)
@@ -1081,16 +1104,67 @@ class SearchDialog(QDialog):
             QApplication.restoreOverrideCursor()
             return
         
-        self.artist_search_worker = Worker(self._search_artist, artist_name)
+        # Supersede any search still in flight, whichever path runs this one
+        if self.artist_search_reply is not None:
+            self.artist_search_reply.abort()
+
+        # Without a fresh token, fall back to a worker that may refresh it
+        access_token = getattr(self.main_window, 'cached_access_token', lambda: None)()
+        if not access_token:
+            self.start_artist_search_worker(artist_name)
+            return
+
+        params = urlencode({"q": artist_name, "type": "artist", "limit": 50})
+        request = QNetworkRequest(QUrl(f"https://api.spotify.com/v1/search?{params}"))
+        request.setRawHeader(b"Authorization", f"Bearer {access_token}".encode())
+        reply = self.network_manager.get(request)
+        reply.finished.connect(partial(self.on_artist_search_reply, reply, artist_name))
+        self.artist_search_reply = reply
+
+    def start_artist_search_worker(self, artist_name, refresh_first=False):
+        """Search for an artist on a worker thread, which can refresh the access token."""
+        self.artist_search_worker = Worker(self._search_artist, artist_name, refresh_first)
         self.artist_search_worker.finished.connect(self.on_artists_fetched)
         self.active_threads.append(self.artist_search_worker)
         self.artist_search_worker.start()
+
+    def on_artist_search_reply(self, reply, artist_name):
+        """Parse a finished artist search reply and hand it to on_artists_fetched."""
+        reply.deleteLater()
+        if reply is self.artist_search_reply:
+            self.artist_search_reply = None
+
+        error = reply.error()
+        if error == QNetworkReply.NetworkError.OperationCanceledError:
+            # Superseded by a newer search; just balance its override cursor
+            QApplication.restoreOverrideCursor()
+            return
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status == 401:
+            # The cached token was rejected; retry on the worker path, which
+            # refreshes it first. on_artists_fetched still restores the cursor.
+            logging.info("Artist search token rejected, refreshing and retrying")
+            self.start_artist_search_worker(artist_name, refresh_first=True)
+            return
+        if error != QNetworkReply.NetworkError.NoError:
+            logging.error(f"Artist search failed: {reply.errorString()}")
+            self.on_artists_fetched({"error": reply.errorString()})
+            return
+
+        try:
+            result = json_loads(reply.readAll().data())
+        except ValueError as e:
+            logging.error(f"Invalid artist search response: {e}")
+            result = {"error": "Invalid response from Spotify"}
+        self.on_artists_fetched(result)
     
-    def _search_artist(self, artist_name):
+    def _search_artist(self, artist_name, refresh_first=False):
         """Modified version that also fetches artist images"""
         if not self.main_window or not hasattr(self.main_window, 'get_access_token'):
             return {"error": "Main window reference is missing"}
             
+        if refresh_first and hasattr(self.main_window, 'refresh_and_save_tokens'):
+            self.main_window.refresh_and_save_tokens()
         access_token = self.main_window.get_access_token()
         if not access_token:
             return {"error": "Authentication required"}
@@ -1103,11 +1177,14 @@ class SearchDialog(QDialog):
             "limit": 50
         }
         try:
-            response = requests.get(url, headers=headers, params=params)
+            http = getattr(self.main_window, 'spotify_session', requests)
+            response = http.get(url, headers=headers, params=params)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
+        except ValueError as e:
+            return {"error": f"Invalid response from Spotify: {e}"}
     
     def on_artists_fetched(self, result):
         QApplication.restoreOverrideCursor()
@@ -1122,41 +1199,51 @@ class SearchDialog(QDialog):
 
         artists = result.get("artists", {}).get("items", [])
         self.main_window.artist_id_map.clear()
-        artist_names = set()
-
+        # Disambiguate every artist whose name appears more than once
+        name_counts = Counter(artist['name'] for artist in artists)
+        display_names = []
         for artist in artists:
-            display_name = artist['name']
-            if display_name in artist_names:
-                display_name = f"{artist['name']} ({artist['followers']['total']} followers)"
-            
-            # Create item with artist name
-            item = QListWidgetItem(display_name)
-            
-            # Set the text alignment to leave room for the icon
-            item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            name = artist['name']
+            if name_counts[name] > 1:
+                display_name = f"{name} ({artist['followers']['total']} followers)"
+            else:
+                display_name = name
+            display_names.append(display_name)
             
             # Store ID in main window's map
             self.main_window.artist_id_map[display_name] = artist['id']
-            artist_names.add(artist['name'])
+
+        # Fill the list in one call, without repainting or signalling per item
+        self.artist_list.setUpdatesEnabled(False)
+        self.artist_list.blockSignals(True)
+        try:
+            self.artist_list.addItems(display_names)
+            for row, artist in enumerate(artists):
+                item = self.artist_list.item(row)
+            
+                # Set the text alignment to leave room for the icon
+                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
             
-            # Get artist image if available
-            image_url = None
-            if artist['images'] and len(artist['images']) > 0:
-                # Find a suitable small image (around 64x64)
-                for img in artist['images']:
-                    if img['width'] <= 100:
-                        image_url = img['url']
-                        break
+                # Get artist image if available
+                image_url = None
+                if artist['images'] and len(artist['images']) > 0:
+                    # Find a suitable small image (around 64x64); Spotify may
+                    # leave the width unset
+                    for img in artist['images']:
+                        if (img.get('width') or 0) <= 100:
+                            image_url = img['url']
+                            break
                 
-                # If no small image found, use the last one (typically smallest)
-                if not image_url and len(artist['images']) > 0:
-                    image_url = artist['images'][-1]['url']
+                    # If no small image found, use the last one (typically smallest)
+                    if not image_url and len(artist['images']) > 0:
+                        image_url = artist['images'][-1]['url']
                 
-                # Download and set the image
-                if image_url:
-                    self.load_artist_image(item, image_url)
-            
-            self.artist_list.addItem(item)
+                    # Download and set the image
+                    if image_url:
+                        self.load_artist_image(item, image_url)
+        finally:
+            self.artist_list.blockSignals(False)
+            self.artist_list.setUpdatesEnabled(True)
             
         if not artists:
             QMessageBox.information(self, "No Results", "No artists found matching your search.")
@@ -1170,14 +1257,14 @@ class SearchDialog(QDialog):
             
         # Download image in a worker thread
         worker = Worker(self._download_image, image_url)
-        worker.finished.connect(lambda result, item=item, url=image_url: 
-                               self._set_artist_image(result, item, url))
+        worker.finished.connect(partial(self._set_artist_image, item=item, url=image_url))
         self.active_threads.append(worker)
         worker.start()
     
     def _download_image(self, image_url):
         try:
-            response = requests.get(image_url, timeout=10)
+            http = getattr(self.main_window, 'spotify_session', requests)
+            response = http.get(image_url, timeout=10)
             response.raise_for_status()
             return response.content
         except Exception as e:
@@ -1242,56 +1329,47 @@ class SearchDialog(QDialog):
 
         albums = result.get('items', [])
         self.album_list.clear()
-        self.main_window.album_id_map.clear()
-
-        # Group albums by name+year
-        albums_by_name_year = {}
-        for album in albums:
-            year = album.get('release_date', '')[:4]
-            name_year_key = f"{album['name']} - {year}"
-            if name_year_key not in albums_by_name_year:
-                albums_by_name_year[name_year_key] = []
-            albums_by_name_year[name_year_key].append(album)
-        
-        # Add items to list
-        self.album_list.blockSignals(True)
-        for album in albums:
-            year = album.get('release_date', '')[:4]
-            name_year_key = f"{album['name']} - {year}"
-            
-            has_duplicates = len(albums_by_name_year[name_year_key]) > 1
-            
-            if has_duplicates:
+
+        # Count albums per name+year so duplicates can be told apart
+        keys = [f"{album['name']} - {album.get('release_date', '')[:4]}" for album in albums]
+        counts = Counter(keys)
+        display_texts = []
+        for album, key in zip(albums, keys):
+            if counts[key] > 1:
                 album_type = album.get('album_type', '').title()
-                display_text = f"{album['name']} - {year} ({album_type})"
+                display_text = f"{key} ({album_type})"
             else:
-                display_text = f"{album['name']} - {year}"
-            
-            # Create item with album name
-            item = QListWidgetItem(display_text)
-            
-            # Store album ID in map
-            self.main_window.album_id_map[display_text] = album['id']
-            
-            # Get album cover if available
-            image_url = None
-            if album['images'] and len(album['images']) > 0:
-                for img in album['images']:
-                    if img['width'] <= 300:  # Get a reasonably sized image
-                        image_url = img['url']
-                        break
-                
-                # If no small image found, use the last one
-                if not image_url and len(album['images']) > 0:
-                    image_url = album['images'][-1]['url']
-                
-                # Download and set the image
-                if image_url:
-                    self.load_album_image(item, image_url)
-            
-            self.album_list.addItem(item)
-        
-        self.album_list.blockSignals(False)
+                display_text = key
+            display_texts.append(display_text)
+
+        # Map display texts to album IDs in one go
+        self.main_window.album_id_map = dict(zip(display_texts, (album['id'] for album in albums)))
+
+        # Add items to list in one call, without repainting or signalling per item
+        self.album_list.setUpdatesEnabled(False)
+        self.album_list.blockSignals(True)
+        try:
+            self.album_list.addItems(display_texts)
+            for row, album in enumerate(albums):
+                # Get album cover if available
+                image_url = None
+                if album['images'] and len(album['images']) > 0:
+                    for img in album['images']:
+                        # Get a reasonably sized image; Spotify may leave the width unset
+                        if (img.get('width') or 0) <= 300:
+                            image_url = img['url']
+                            break
+                    
+                    # If no small image found, use the last one
+                    if not image_url and len(album['images']) > 0:
+                        image_url = album['images'][-1]['url']
+                    
+                    # Download and set the image
+                    if image_url:
+                        self.load_album_image(self.album_list.item(row), image_url)
+        finally:
+            self.album_list.blockSignals(False)
+            self.album_list.setUpdatesEnabled(True)
 
     def load_album_image(self, item, image_url):
         """Load album cover image and set it as item icon"""
@@ -1302,8 +1380,7 @@ class SearchDialog(QDialog):
             
         # Download image in a worker thread
         worker = Worker(self._download_image, image_url)
-        worker.finished.connect(lambda result, item=item, url=image_url: 
-                            self._set_album_image(result, item, url))
+        worker.finished.connect(partial(self._set_album_image, item=item, url=image_url))
         self.active_threads.append(worker)
         worker.start()
 
@@ -1425,6 +1502,10 @@ class AlbumItemDelegate(QStyledItemDelegate):
         return QSize(size.width(), 60)
 
 class SettingsDialog(QDialog):
+    # Entries of the preferred music player combo and their indexes
+    MUSIC_PLAYERS = ["Spotify", "Tidal"]
+    PLAYER_INDEX = {player: index for index, player in enumerate(MUSIC_PLAYERS)}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._parent = parent
@@ -1572,10 +1653,10 @@ class SettingsDialog(QDialog):
         preferred_music_player_label = QLabel("Preferred Music Player:")
         self.preferred_music_player_combo = QComboBox()
         self.preferred_music_player_combo.setObjectName("settings_combo")
-        self.preferred_music_player_combo.addItems(["Spotify", "Tidal"])
+        self.preferred_music_player_combo.addItems(self.MUSIC_PLAYERS)
         if hasattr(self._parent, 'preferred_music_player'):
-            index = self.preferred_music_player_combo.findText(self._parent.preferred_music_player)
-            if index >= 0:
+            index = self.PLAYER_INDEX.get(self._parent.preferred_music_player)
+            if index is not None:
                 self.preferred_music_player_combo.setCurrentIndex(index)
         
         app_settings_layout.addRow(preferred_music_player_label, self.preferred_music_player_combo)
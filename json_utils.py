@@ -0,0 +1,23 @@
+# json_utils.py
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library json module is used instead
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize obj to two-space indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
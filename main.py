@@ -3,31 +3,41 @@
 from PyQt6.QtWidgets import (QDialog, QMenu, QGroupBox, QFileDialog, QComboBox, QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QListWidget, QMessageBox,
                              QProgressDialog, QAbstractItemView, QHeaderView, QTableView,)
-from PyQt6.QtGui import QAction, QIcon, QPixmap, QDropEvent, QFont, QDesktopServices, QPen, QColor, QPainter, QDrag, QCursor
-from PyQt6.QtCore import (Qt, QFile, QTextStream, QIODevice, pyqtSignal, QThread, QTimer, QObject, QUrl, QItemSelectionModel, QPoint,
+from PyQt6.QtGui import QAction, QIcon, QPixmap, QImage, QDropEvent, QFont, QDesktopServices, QPen, QColor, QPainter, QDrag, QCursor
+from PyQt6.QtCore import (Qt, QFile, QTextStream, QIODevice, pyqtSignal, QThread, QTimer, QObject, QUrl, QItemSelectionModel, QPoint, QMetaObject,
                           QParallelAnimationGroup, QByteArray, QBuffer, QAbstractAnimation, QPropertyAnimation, QEasingCurve, QRect)
 from datetime import datetime
 from pathlib import Path
-from PIL import Image
-from io import BytesIO
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import hashlib
-import shutil
 import base64
-from functools import partial
+from functools import lru_cache, partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
 import sys
 import urllib.parse
 import subprocess
+import shutil
+import stat
+import threading
 import time
+import bisect
+import copy
+import re
+import html
 
 from album_model import AlbumModel
 
-from dialogs import HelpDialog, LogViewerDialog, ManualAddAlbumDialog, SubmitDialog, UpdateDialog, SendGenreDialog, GenreUpdateDialog
+from dialogs import (HelpDialog, LogViewerDialog, ManualAddAlbumDialog, SubmitDialog, UpdateDialog, SendGenreDialog,
+                     GenreUpdateDialog, FILE_DIALOG_OPTIONS)
 from workers import DownloadWorker, Worker
 from menu_bar import MenuBar
+from spotify_auth import SpotifyAuth
+from json_utils import json_loads, json_dumps
 
 from delegates import (
     ComboBoxDelegate, SearchHighlightDelegate, GenreSearchDelegate, strip_html_tags, CoverImageDelegate
@@ -112,19 +122,443 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".") # Fallback
     return os.path.join(base_path, relative_path)
 
-def read_file_lines(filepath, transform=None):
-    correct_path = resource_path(filepath)
+def read_file_lines(filepath, transform=None, sort=False):
+    """
+    Read the unique, stripped lines of a bundled text file.
+
+    Lines keep their file order unless sort is True, which is needed when
+    transform returns an unordered collection.
+    """
+    # Qt resource paths (":/...") are passed to QFile untouched
+    correct_path = filepath if filepath.startswith(':/') else resource_path(filepath)
     logging.debug(f"Reading file: {correct_path}")
+    file = QFile(correct_path)
     try:
-        with open(correct_path, 'r') as file:
-            lines = set(line.strip() for line in file)
-            if transform:
-                lines = transform(lines)
-            logging.debug(f"Read {len(lines)} lines from {filepath}")
-            return sorted(lines)
+        if not file.open(QIODevice.OpenModeFlag.ReadOnly):
+            raise OSError(file.errorString())
+        # Read the whole asset in one call and split it in memory
+        data = bytes(file.readAll()).decode('utf-8')
+        # dict.fromkeys de-duplicates while preserving the curated file order
+        lines = list(dict.fromkeys(line.strip() for line in data.splitlines()))
+        if transform:
+            lines = transform(lines)
+        logging.debug(f"Read {len(lines)} lines from {filepath}")
+        return sorted(lines) if sort else list(lines)
     except Exception as e:
         logging.error(f"Failed to read file {filepath}: {e}")
         return []
+    finally:
+        file.close()
+
+# True when running from a PyInstaller bundle; fixed for the life of the process
+IS_PACKAGED = getattr(sys, 'frozen', False)
+
+@lru_cache(maxsize=None)
+def user_data_dir(packaged=False):
+    """
+    Return the user-specific application data directory, creating it if needed.
+    Computed once per session for each value of packaged.
+    """
+    app_name = 'SuSheApp'
+
+    if sys.platform == 'win32':
+        appdata = os.getenv('APPDATA')
+        if appdata is not None:
+            app_data_dir = os.path.join(appdata, app_name)
+        else:
+            app_data_dir = os.path.join(os.path.expanduser('~'), app_name)
+    elif sys.platform == 'darwin':
+        app_data_dir = os.path.join(os.path.expanduser('~/Library/Application Support/'), app_name)
+    else:  # Linux and other Unix-like OSes
+        app_data_dir = os.path.join(os.path.expanduser('~'), '.SuSheApp')
+
+    if packaged:
+        # Use a subdirectory for packaged application settings
+        app_data_dir = os.path.join(app_data_dir, 'packaged')
+
+    os.makedirs(app_data_dir, exist_ok=True)  # Ensure directory is created
+    return app_data_dir
+
+def load_genres():
+    """Return the sorted, title-cased genre list from genres.txt."""
+    return read_file_lines('genres.txt', transform=lambda lines: {line.title() for line in lines}, sort=True)
+
+# Parsed JSON files keyed by path, stored as (st_mtime_ns, data)
+_json_file_cache = {}
+
+def load_json_cached(path):
+    """
+    Return the parsed contents of a JSON file, re-reading it only when its
+    modification time changes. Callers get their own copy, so mutating the
+    result never changes the cached entry.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_file_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, 'rb') as file:
+            cached = (mtime, json_loads(file.read()))
+        _json_file_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
+def atomic_write_bytes(path, data, durable=False, mode=0o666):
+    """
+    Replace the file at path with data without ever leaving a half-written file.
+
+    The bytes go to a sibling .tmp file in a single write and the temporary file
+    is then renamed over the target with os.replace. The data is only fsynced
+    before the rename when durable is set. A replaced file keeps its permissions;
+    a new one is created with mode (before the umask). If writing fails the
+    temporary file is removed.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        existing_mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), mode)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if existing_mode is not None:
+            os.chmod(tmp_path, existing_mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def write_json_cached(path, data, durable=False):
+    """Atomically write data to a JSON file and refresh its cache entry."""
+    encoded = json_dumps(data)
+    atomic_write_bytes(path, encoded, durable=durable)
+    # Cache a fresh parse of what was written, not the caller's object
+    _json_file_cache[path] = (os.stat(path).st_mtime_ns, json_loads(encoded))
+
+def read_album_file(file_path):
+    """Read a saved album list."""
+    with open(file_path, 'rb') as file:
+        return json_loads(file.read())
+
+def write_album_file(file_path, album_data):
+    """
+    Write an album list as indented JSON with atomic_write_bytes, so an
+    interrupted save never truncates the list. Returns file_path.
+    """
+    # Encode before touching the disk
+    atomic_write_bytes(file_path, json_dumps(album_data))
+    return file_path
+
+# Column widths of the HTML export, including the row number column
+HTML_EXPORT_COLUMN_WIDTHS = {
+    "No.": "5px",
+    "Artist": "60px",
+    "Album": "60px",
+    "Release Date": "40px",
+    "Cover": "40px",
+    "Country": "60px",
+    "Genre 1": "80px",
+    "Genre 2": "80px",
+    "Comments": "150px"
+}
+
+def _build_html_export_header():
+    """Document head and table header of the HTML export, ending after the header row."""
+    header_lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        "<meta charset='utf-8'>",
+        "<title>Exported Albums</title>",
+        "<style>",
+        "body { font-family: Arial, sans-serif; }",
+        "table { border-collapse: collapse; width: 100%; table-layout: fixed; }",
+        "th, td { border: 1px solid #ccc; padding: 8px; text-align: left; word-wrap: break-word; }",
+        "th { background-color: #f2f2f2; }",
+        "td img { display: block; margin: 0 auto; }",  # Center images in cells
+        "</style>",
+        "</head>",
+        "<body>",
+        "<h1>Album Export</h1>",
+        "<table>",
+        "<tr>"
+    ]
+    for header, width in HTML_EXPORT_COLUMN_WIDTHS.items():
+        header_lines.append(f"<th style='width:{width};'>{header}</th>")
+    header_lines.append("</tr>")
+    return "\n".join(header_lines) + "\n"
+
+# Built once at import; every export starts with it
+HTML_EXPORT_HEADER = _build_html_export_header()
+
+def write_albums_html(file_path, albums):
+    """Export album dicts to file_path as an HTML table. Returns file_path."""
+    # Each row is written around its cover, so the base64 string goes to the
+    # file as-is instead of being copied into an <img> tag and then a row string
+    row_head_template = "<tr><td>%d</td><td>%s</td><td>%s</td><td>%s</td><td>"
+    row_tail_template = "</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>\n"
+    # Cell text only needs &, < and > escaped; skipping quotes saves two passes per field
+    escape = partial(html.escape, quote=False)
+
+    # Rows are streamed to the file rather than collected into one big string
+    with open(file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write = f.write
+        write(HTML_EXPORT_HEADER)
+        for no, album in enumerate(albums, start=1):
+            write(row_head_template % (
+                no,
+                escape(album.get("artist") or ""),
+                escape(album.get("album") or ""),
+                escape(album.get("release_date") or ""),
+            ))
+            base64_image = album.get("cover_image")
+            if base64_image:
+                image_format = album.get("cover_image_format", "PNG").lower()
+                write(f'<img src="data:image/{image_format};base64,')
+                write(base64_image)
+                write('" width="100" />')
+            write(row_tail_template % (
+                escape(album.get("country") or ""),
+                escape(album.get("genre_1") or ""),
+                escape(album.get("genre_2") or ""),
+                escape(album.get("comments") or ""),
+            ))
+        write("</table>\n</body></html>")
+    return file_path
+
+# Client ID of the SuShe Spotify app, used for the PKCE login flow
+SPOTIFY_CLIENT_ID = "2241ba6e592a4d60aa18c81a8507f0b3"
+
+# Style of the album table's row-number header
+V_HEADER_QSS = """
+    QHeaderView::section:vertical {
+        background-color: #1A1A1A;
+        color: #1DB954;  /* Spotify green */
+        font-weight: bold;
+        border: none;
+        border-right: 1px solid #333333;
+        padding: 4px;
+    }
+"""
+
+# Config values copied onto the main window: (attribute, dotted config key, default)
+CONFIG_FIELDS = [
+    ('bot_token', 'telegram.bot_token', ''),
+    ('chat_id', 'telegram.chat_id', ''),
+    ('message_thread_id', 'telegram.message_thread_id', ''),
+    ('github_token', 'github.personal_access_token', ''),
+    ('github_owner', 'github.owner', ''),
+    ('github_repo', 'github.repo', ''),
+    ('preferred_music_player', 'application.preferred_music_player', 'Spotify'),
+    ('webhook_url', 'webhook.url', ''),
+]
+
+@lru_cache(maxsize=None)
+def _split_config_key(dotted):
+    return tuple(dotted.split('.'))
+
+def config_get(config, dotted, default=''):
+    """Look up a dotted key such as 'telegram.bot_token' in a nested config dict."""
+    value = config
+    for part in _split_config_key(dotted):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+def _version_tuple(version_string):
+    """Return a plain 'X.Y.Z' (optionally 'v'-prefixed) version as an int tuple, or None."""
+    parts = version_string.strip().lstrip('vV').split('.')
+    if not all(part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
+
+def is_newer_version(latest, current):
+    """
+    Return True if version string latest is newer than current.
+
+    Plain numeric versions are compared as int tuples, zero-padded to the same
+    length so that "2.1.0" equals "2.1"; anything else (pre-release tags and
+    the like) falls back to packaging's PEP 440 parser.
+
+    >>> is_newer_version("2.1.0", "2.1")
+    False
+    >>> is_newer_version("v2.1.1", "2.1")
+    True
+    >>> is_newer_version("2.1", "2.0.9")
+    True
+    """
+    latest_tuple = _version_tuple(latest)
+    current_tuple = _version_tuple(current)
+    if latest_tuple is not None and current_tuple is not None:
+        width = max(len(latest_tuple), len(current_tuple))
+        latest_tuple += (0,) * (width - len(latest_tuple))
+        current_tuple += (0,) * (width - len(current_tuple))
+        return latest_tuple > current_tuple
+    from packaging import version
+    return version.parse(latest) > version.parse(current)
+
+def git_blob_sha(data):
+    """Return the git blob SHA-1 of data (bytes), as reported by the GitHub contents API."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+_quote = urllib.parse.quote
+
+# Track or album ID from an open.spotify.com link
+SPOTIFY_URI_RE = re.compile(r'open\.spotify\.com/(track|album)/([A-Za-z0-9]+)')
+
+def spotify_album_url(album_id, artist_name, album_name):
+    """Spotify URI for the album, or a Spotify search when there's no album ID."""
+    if album_id:
+        return f'spotify:album:{album_id}'
+    logging.info(f"No Spotify album ID available for '{album_name}', falling back to search")
+    return f'spotify:search:{_quote(f"{artist_name} {album_name}")}'
+
+def tidal_album_url(album_id, artist_name, album_name):
+    """Tidal web search for the album; more stable than Tidal's album search."""
+    return f'https://listen.tidal.com/search?q={_quote(f"{artist_name} {album_name}")}'
+
+def web_search_album_url(album_id, artist_name, album_name):
+    """Generic web search for the album, used for unknown players."""
+    return f'https://www.google.com/search?q={_quote(f"{artist_name} {album_name}")}+album'
+
+# Album URL builder for each preferred music player
+ALBUM_URL_BUILDERS = {
+    'Spotify': spotify_album_url,
+    'Tidal': tidal_album_url,
+}
+
+@lru_cache(maxsize=512)
+def build_album_url(player, album_id, artist_name, album_name):
+    """Album URL for the given music player, memoized since the builders are pure."""
+    builder = ALBUM_URL_BUILDERS.get(player)
+    if builder is None:
+        logging.warning(f"Unknown music player preference: {player}")
+        # Default to a generic web search as fallback
+        builder = web_search_album_url
+    return builder(album_id, artist_name, album_name)
+
+def backup_tokens_file(tokens_path):
+    """
+    Move a saved Spotify tokens file aside to a .bak copy, replacing any
+    previous backup. Falls back to deleting the file if it can't be moved.
+    """
+    backup_path = f"{tokens_path}.bak"
+    try:
+        os.replace(tokens_path, backup_path)
+        logging.info(f"Created token backup at {backup_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"Failed to create token backup: {e}")
+
+        # Try direct removal if backup fails
+        try:
+            os.remove(tokens_path)
+        except OSError as e2:
+            logging.error(f"Failed to remove token file: {e2}")
+
+def launch_url(url):
+    """
+    Hand url to the platform's opener and return without waiting for it;
+    the opener only has to start, not exit.
+    """
+    if sys.platform.startswith('win'):
+        os.startfile(url)
+        return
+    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    subprocess.Popen([opener, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+def _stat_ok(path):
+    """True if path can be stat'ed; a bare os.stat without os.path.exists' wrapper."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+@lru_cache(maxsize=None)
+def spotify_installed():
+    """
+    Check if Spotify is installed on the system. The probe runs once per
+    session; call spotify_installed.cache_clear() to run it again.
+    """
+    try:
+        if sys.platform.startswith('win'):
+            # Check Windows Registry
+            import winreg
+            try:
+                # Keys left by the Spotify installer; the per-user uninstall
+                # entry also records where the client lives
+                registry_keys = [
+                    (winreg.HKEY_CURRENT_USER, r"Software\Spotify"),
+                    (winreg.HKEY_LOCAL_MACHINE, r"Software\Spotify"),
+                    (winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall\Spotify"),
+                ]
+                for hive, sub_key in registry_keys:
+                    try:
+                        key = winreg.OpenKey(hive, sub_key, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+                    except OSError:
+                        continue
+                    try:
+                        value, value_type = winreg.QueryValueEx(key, "InstallLocation")
+                        if value_type == winreg.REG_SZ:
+                            logging.info(f"Found Spotify at {value}")
+                    except OSError:
+                        pass  # The key itself is enough to count as installed
+                    finally:
+                        winreg.CloseKey(key)
+                    return True
+
+                # Also check for Spotify.exe in common locations
+                program_files = os.environ.get('PROGRAMFILES', 'C:\\Program Files')
+                program_files_x86 = os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')
+
+                paths_to_check = [
+                    os.path.join(program_files, 'Spotify', 'Spotify.exe'),
+                    os.path.join(program_files_x86, 'Spotify', 'Spotify.exe'),
+                    os.path.join(os.environ.get('APPDATA', ''), 'Spotify', 'Spotify.exe')
+                ]
+
+                found = next((path for path in paths_to_check if _stat_ok(path)), None)
+                if found:
+                    logging.info(f"Found Spotify at {found}")
+                    return True
+
+                return False
+            except Exception as e:
+                logging.warning(f"Error checking Windows registry: {e}")
+                return False
+        elif sys.platform == 'darwin':
+            # Check macOS Applications folder
+            paths = [
+                "/Applications/Spotify.app",
+                os.path.expanduser("~/Applications/Spotify.app")
+            ]
+            return any(_stat_ok(path) for path in paths)
+        else:
+            # Basic check for Linux: look spotify up on PATH in-process
+            return shutil.which('spotify') is not None
+    except Exception as e:
+        logging.warning(f"Error checking if Spotify is installed: {e}")
+        return False  # Assume not installed if check fails
+
+@lru_cache(maxsize=None)
+def read_app_version():
+    """Read version.txt once per session."""
+    version_file = resource_path('version.txt')
+    logging.debug("Looking for version file at: %s", version_file)
+    with open(version_file, 'r') as f:
+        return f.read().strip()
 
 class DragDropTableView(QTableView):
     """
@@ -134,10 +568,10 @@ class DragDropTableView(QTableView):
         super().__init__(parent)
         self.setShowGrid(True)
         h_header = self.horizontalHeader()
-        if h_header:
+        if h_header is not None:
             h_header.setHighlightSections(False)
         v_header = self.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setHighlightSections(False)
         
         # States for drag operation
@@ -151,6 +585,7 @@ class DragDropTableView(QTableView):
         
         # Animation properties
         self.row_animations = {}  # Store animations by row index
+        self._last_anim_value = {}  # Last applied pixel value per animated row
         self.animation_group = QParallelAnimationGroup(self)
         self.animation_group.finished.connect(self.on_animation_finished)
         self.animation_duration = 150  # Slightly faster animation (was 200ms)
@@ -164,7 +599,7 @@ class DragDropTableView(QTableView):
         
         # Set a consistent row height
         v_header = self.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setDefaultSectionSize(100)
         
         # Enable smooth scrolling
@@ -194,14 +629,14 @@ class DragDropTableView(QTableView):
                 model = self.model()
                 if model is None:
                     return
-                rect = self.visualRect(model.index(self.hover_row, 0))
-                vp = self.viewport()
-                if vp:
-                    rect.setWidth(vp.width())
-                rect.setHeight(self.rowHeight(self.hover_row))
+                rect = self._row_stripe_rect(self.hover_row)
+                
+                # Nothing to do if the hovered row is outside the exposed region
+                if e is None or not rect.intersects(e.rect()):
+                    return
                 
                 painter = QPainter(self.viewport())
-                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                painter.setClipRect(e.rect())
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.setBrush(QColor(255, 255, 255, 10))  # Very subtle highlight
                 painter.drawRect(rect)
@@ -230,35 +665,57 @@ class DragDropTableView(QTableView):
         viewport = self.viewport()
         if viewport:  # Check if viewport exists before using it
             index = self.indexAt(pos)
-            if index.isValid():
-                self.hover_row = index.row()
-            else:
-                self.hover_row = -1
-            viewport.update()
+            previous_row = self.hover_row
+            self.hover_row = index.row() if index.isValid() else -1
+            if self.hover_row == previous_row:
+                return
+            
+            # Only repaint the stripes of the rows that gained or lost hover
+            for row in (previous_row, self.hover_row):
+                if row >= 0:
+                    viewport.update(self._row_stripe_rect(row))
+
+    def _row_stripe_rect(self, row):
+        """Return the full-width viewport rectangle covered by the given row."""
+        rect = QRect()
+        model = self.model()
+        if model is None:
+            return rect
+        rect = self.visualRect(model.index(row, 0))
+        vp = self.viewport()
+        if vp:
+            rect.setLeft(0)
+            rect.setWidth(vp.width())
+        rect.setHeight(self.rowHeight(row))
+        return rect
 
     def startDrag(self, supportedActions):
-        indexes = self.selectedIndexes()
-        if not indexes:
+        sel_model = self.selectionModel()
+        if sel_model is None:
             return
         
-        # Get all unique rows
-        rows = set()
-        for index in indexes:
-            if index.isValid():
-                rows.add(index.row())
-        
-        # Store dragged rows
-        self.dragged_rows = sorted(list(rows))
-        self.drag_active = True
+        # Get all unique rows from the selection ranges rather than from
+        # every selected (row, column) index
+        rows = {
+            row
+            for selection_range in sel_model.selection()
+            for row in range(selection_range.top(), selection_range.bottom() + 1)
+        }
+        if not rows:
+            return
         
         # Check if model exists before accessing its methods
         model = self.model()
         if model is None:
             logging.error("Cannot start drag: No model is set for the table view.")
             return
+        
+        # Store dragged rows
+        self.dragged_rows = sorted(rows)
+        self.drag_active = True
             
-        # Create mime data
-        mime_data = model.mimeData(indexes)
+        # Create mime data from one index per dragged row
+        mime_data = model.mimeData([model.index(row, 0) for row in self.dragged_rows])
         
         # Create a QDrag object
         drag = QDrag(self)
@@ -321,21 +778,11 @@ class DragDropTableView(QTableView):
             cover_index = model.index(row, cover_column)
             cover_rect = self.visualRect(cover_index)
             
-            # Draw cover image if available
-            base64_image = model.data(cover_index, Qt.ItemDataRole.UserRole)
-            if base64_image:
+            # Draw cover image if available, reusing the model's decoded pixmap
+            cover_pixmap = model.data(cover_index, Qt.ItemDataRole.DecorationRole)
+            if isinstance(cover_pixmap, QPixmap) and not cover_pixmap.isNull():
                 try:
-                    # Decode and create the image
-                    import base64
-                    from PyQt6.QtGui import QImage
-                    
-                    image_bytes = base64.b64decode(base64_image)
-                    image = QImage.fromData(image_bytes)
-                    cover_pixmap = QPixmap.fromImage(image)
-                    
-                    # Calculate image rect with some padding
-                    img_x = cover_rect.x() + 5
-                    img_y = target_y + 5
+                    # Calculate image size with some padding
                     img_width = cover_rect.width() - 10
                     img_height = row_height - 10
                     
@@ -552,7 +999,7 @@ class DragDropTableView(QTableView):
             
             # Update vertical header to reflect new order
             v_header = self.verticalHeader()
-            if v_header:
+            if v_header is not None:
                 v_header.update()
             
             event.acceptProposedAction()
@@ -569,6 +1016,7 @@ class DragDropTableView(QTableView):
         while self.animation_group.animationCount() > 0:
             self.animation_group.takeAnimation(0)
         self.row_animations.clear()
+        self._last_anim_value.clear()
         
         # Get current visual positions of all rows
         current_positions = {}
@@ -609,25 +1057,12 @@ class DragDropTableView(QTableView):
                 animation.setEndValue(target_rect.y())
                 animation.setEasingCurve(QEasingCurve.Type.OutQuad)  # Smoother easing
                 
-                # Store the animation reference
+                # Store the animation reference and the row it drives
                 self.row_animations[row] = animation
+                animation.setProperty('row', row)
                 
-                # Value change handler to update row position
-                def create_update_callback(row_num):
-                    def update_position(value):
-                        # Calculate offset from current position
-                        current_rect = self.visualRect(self.model().index(row_num, 0))
-                        offset = value - current_rect.y()
-                        
-                        # Adjust the row height to create the animation effect
-                        if offset != 0:
-                            self.setRowHeight(row_num, self.rowHeight(row_num) + offset)
-                            self.update()
-                    return update_position
-                
-                # Connect the animation value changed signal
-                update_callback = create_update_callback(row)
-                animation.valueChanged.connect(update_callback)
+                # All row animations share a single bound value-changed handler
+                animation.valueChanged.connect(self._on_anim_value_changed)
                 
                 # Add to parallel animation group
                 self.animation_group.addAnimation(animation)
@@ -635,6 +1070,30 @@ class DragDropTableView(QTableView):
         # Start the animations
         self.animation_group.start()
 
+    def _on_anim_value_changed(self, value):
+        """Update the animated row's position; the row is read from the sending animation."""
+        animation = self.sender()
+        if animation is None:
+            return
+        row_num = animation.property('row')
+        if row_num is None:
+            return
+
+        # Skip frames where the value rounds to the same pixel as the last one
+        pixel_value = int(round(value))
+        if self._last_anim_value.get(row_num) == pixel_value:
+            return
+        self._last_anim_value[row_num] = pixel_value
+
+        # Calculate offset from current position
+        current_rect = self.visualRect(self.model().index(row_num, 0))
+        offset = pixel_value - current_rect.y()
+        
+        # Adjust the row height to create the animation effect
+        if offset != 0:
+            self.setRowHeight(row_num, self.rowHeight(row_num) + offset)
+            self.update()
+
     def on_animation_finished(self):
         """Called when animations complete to reset row heights."""
         for row in range(self.model().rowCount()):
@@ -652,32 +1111,53 @@ class DragDropTableView(QTableView):
         return self.columnWidth(column)
 
 class QTextEditLogger(logging.Handler, QObject):
-    log_signal = pyqtSignal(str)
+    BUFFER_SIZE = 5000  # Maximum number of messages kept while the log viewer is hidden
+    FLUSH_INTERVAL_MS = 50  # How often buffered messages are moved into the log viewer
 
     def __init__(self):
         QObject.__init__(self)
         logging.Handler.__init__(self)
         self.log_viewer = None
-        self.buffer = []  # Buffer to store log messages before log_viewer is set
-        self.log_signal.connect(self._append_log)
+        self.buffer = deque(maxlen=self.BUFFER_SIZE)  # Bounded buffer of messages not yet shown
+        self.buffer_lock = threading.Lock()  # Records arrive from worker threads too
+        # Started once there is a viewer, since the handler exists before the QApplication
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_to_viewer)
 
     def emit(self, record):
         msg = self.format(record)
-        self.buffer.append(msg)
-        self.log_signal.emit(msg)
+        with self.buffer_lock:
+            self.buffer.append(msg)
 
-    def _append_log(self, msg):
-        if self.log_viewer:
-            self.log_viewer.append_log(msg)
+    def flush_to_viewer(self):
+        """Move buffered messages into the visible log viewer in a single append."""
+        if self.log_viewer is None or not self.log_viewer.isVisible():
+            return
+        with self.buffer_lock:
+            if not self.buffer:
+                return
+            batch = list(self.buffer)
+            self.buffer.clear()
+        self.log_viewer.append_log('\n'.join(batch))
 
     def set_log_viewer(self, log_viewer):
         self.log_viewer = log_viewer
-        for msg in self.buffer:
-            self.log_viewer.append_log(msg)
-        self.buffer.clear()
+        self.flush_timer.start()
 
 class SpotifyAlbumAnalyzer(QMainWindow):
     auth_required_signal = pyqtSignal()
+    album_ready_signal = pyqtSignal(object)  # Album dict with its processed cover
+    manual_cover_ready_signal = pyqtSignal(object, object)  # Album dict, (base64 cover, format)
+    SEARCH_BLOB_THRESHOLD = 5000  # Indexed cells above which searches use bytes.find
+    V_HEADER_MIN_WIDTH = 30  # Row-number header width, enough for double-digit numbers
+    MAX_RECENT_FILES = 5  # Entries kept in the Recent Files menu
+    TOKEN_REFRESH_MARGIN = 360  # Seconds before expiry to refresh the access token in the background
+    TOKEN_REFRESH_RETRY_MIN = 30  # First retry delay in seconds after a failed background refresh
+    TOKEN_REFRESH_RETRY_MAX = 600  # Longest retry delay, reached by doubling
+    GENRES_REMOTE_CACHE = 'genres_remote.txt'  # Body of the last fetched remote genres.txt
+    # open_album_url handler for each URL scheme; anything else goes to _open_other_url
+    URL_OPENERS = {'spotify': '_open_spotify_uri', 'http': '_open_web_url', 'https': '_open_web_url'}
     def __init__(self, text_edit_logger):
         super().__init__()
         self.statusBar().showMessage("Welcome to SuShe!", 5000)
@@ -685,7 +1165,8 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.version = self.get_app_version()
         self.current_file_path = None
         self.last_opened_file = None
-        self.recent_files = []
+        self.recent_files = deque(maxlen=self.MAX_RECENT_FILES)  # Most recent first
+        self.recent_file_actions = []  # Reused QActions of the Recent Files menu
         self.bot_token = None
         self.chat_id = None
         self.message_thread_id = None
@@ -696,11 +1177,70 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.webhook_url = ""
         self.show_positions = True
 
+        # Shared HTTP session for GitHub calls and the ETag-keyed results of
+        # previous requests, persisted in settings.json
+        self._http_session = requests.Session()
+        self.http_cache = {}
+
+        # Keep-alive session for Spotify API and cover image requests, shared
+        # by the worker threads and the search dialog
+        self.spotify_session = requests.Session()
+        self.spotify_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Spotify OAuth handler, shared by login, logout and token refresh
+        self.spotify_auth = SpotifyAuth(SPOTIFY_CLIENT_ID)
+        self.spotify_auth.auth_complete.connect(self.on_spotify_auth_complete)
+        self.spotify_auth.auth_timeout.connect(self.on_spotify_auth_timeout)
+
+        # Last validated access token and its expiry, for get_access_token's fast path
+        self._token_fastcache = (None, 0)
+
+        # Serializes token refreshes, since Spotify rotates the refresh token and a
+        # used one can't be spent twice. The short commit lock makes the logout
+        # check and the write of refreshed tokens one step; logout bumps the
+        # generation so a refresh in flight never logs the user back in.
+        self._token_lock = threading.Lock()
+        self._token_commit_lock = threading.Lock()
+        self._logout_generation = 0
+
+        # Modification time of spotify_tokens.json when it was last loaded
+        self._spotify_tokens_mtime = None
+
+        # Refreshes the access token ahead of expiry so API calls never wait on it
+        self.token_refresh_timer = QTimer(self)
+        self.token_refresh_timer.setSingleShot(True)
+        self.token_refresh_timer.timeout.connect(self.refresh_tokens_in_background)
+        self.token_refresh_worker = None
+        self._token_refresh_retry = self.TOKEN_REFRESH_RETRY_MIN
+
+        # Bursts of model change signals collapse into one title update per event loop pass
+        self.title_timer = QTimer(self)
+        self.title_timer.setSingleShot(True)
+        self.title_timer.setInterval(0)
+        self.title_timer.timeout.connect(self.update_window_title)
+
+        # Update download state, created on first use
+        self.download_thread = None
+        self.download_worker = None
+        self.download_cancelled = False
+        self.progress_dialog = None
+
         # Initialize search-related variables
         self.matches = []
         self.current_match_index = -1
+        self._search_index = None  # Lazily built list of (row, column, lowercase text)
+        self._search_blob = None  # bytes.find buffer over the index, for large lists
+        self._search_starts = []
+        self._last_search = ('', [])  # Previous query and its matching index entries
+
+        # Rendered help.md, keyed by file mtime
+        self._help_html_cache = None
+        self._help_html_mtime = 0
+        self._markdown = None  # markdown.Markdown instance, created on first help view
 
         self.auth_required_signal.connect(self.show_auth_required_dialog)
+        self.album_ready_signal.connect(self._on_album_ready)
+        self.manual_cover_ready_signal.connect(self._on_manual_cover_ready)
 
     def perform_initialization(self):
         # Initialize UI and other components
@@ -711,26 +1251,16 @@ class SpotifyAlbumAnalyzer(QMainWindow):
 
         # Load Spotify tokens
         self.load_spotify_tokens()
+        self.schedule_token_refresh()
         
         if self.last_opened_file and os.path.exists(self.last_opened_file):
+            # Sets current_file_path and the title once the file is read
             self.load_album_data(self.last_opened_file)
-            self.current_file_path = self.last_opened_file
-            self.update_window_title()
-            self.dataChanged = False
 
-        # Check for application updates first
-        should_show = self.check_for_updates()
-        
-        if should_show:
-            # Show the main window after update check is done
-            self.show()
-            
-            # Also check for genre definition updates, but with a slight delay
-            # to avoid too many operations at startup
-            QTimer.singleShot(2000, self.check_for_genre_updates)
-        else:
-            # The user chose to download an update; exit the application
-            logging.info("Exiting application after initiating update download.")
+        # Show the main window right away; the update checks start once it has
+        # been painted and run in the background
+        self.show()
+        QTimer.singleShot(200, self.check_for_updates)
 
     def initUI(self):
         self.menu_bar = MenuBar(self)
@@ -743,6 +1273,13 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.artist_search_worker = None
         self.albums_fetch_worker = None
         self.album_details_worker = None
+        self.album_save_worker = None
+        self.album_load_worker = None
+        self.html_export_worker = None
+        # Cover downloads start as soon as the album JSON is in
+        self.cover_executor = ThreadPoolExecutor(max_workers=4)
+        # Names of albums being added whose covers are still processing
+        self.pending_album_names = set()
 
         self.setAcceptDrops(True)
         self.resize(1550, 800)
@@ -750,7 +1287,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.setWindowIcon(QIcon(resource_path(os.path.join("logos", "logo.ico"))))
         
         # Initialize genres and countries before setting up tabs
-        self.genres = read_file_lines('genres.txt', transform=lambda lines: {line.title() for line in lines})
+        self.genres = load_genres()
         self.countries = read_file_lines('countries.txt')
         
         self.setup_tabs()
@@ -775,6 +1312,11 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.notification_image_label.setGeometry(0, 0, 100, 100)
         self.notification_image_label.hide()
 
+        # A single restartable timer hides the notification and its image
+        self.notification_timer = QTimer(self)
+        self.notification_timer.setSingleShot(True)
+        self.notification_timer.timeout.connect(self.hide_notification)
+
     def show_auth_required_dialog(self):
         """Shows the authentication required dialog on the main thread"""
         logging.info("Showing authentication required dialog on main thread")
@@ -805,6 +1347,8 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             # Set the log_viewer in text_edit_logger
             self.text_edit_logger.set_log_viewer(self.log_viewer_dialog)
         self.log_viewer_dialog.show()
+        # Catch up on messages logged while the viewer was hidden
+        self.text_edit_logger.flush_to_viewer()
 
     def load_config(self):
         config_path = self.get_user_data_path('config.json')
@@ -812,7 +1356,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         # Define default configuration in code as fallback
         default_config = {
             "spotify": {
-                "default_client_id": "2241ba6e592a4d60aa18c81a8507f0b3"
+                "default_client_id": SPOTIFY_CLIENT_ID
             },
             "telegram": {
                 "bot_token": "",
@@ -839,27 +1383,12 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as file:
-                    config = json.load(file)
-                    # Load Telegram credentials
-                    self.bot_token = config.get('telegram', {}).get('bot_token', '')
-                    self.chat_id = config.get('telegram', {}).get('chat_id', '')
-                    self.message_thread_id = config.get('telegram', {}).get('message_thread_id', '')
-
-                    # Load GitHub credentials
-                    self.github_token = config.get('github', {}).get('personal_access_token', '')
-                    self.github_owner = config.get('github', {}).get('owner', '')
-                    self.github_repo = config.get('github', {}).get('repo', '')
-
-                    # Load Preferred Music Player
-                    self.preferred_music_player = config.get('application', {}).get('preferred_music_player', 'Spotify')
-
-                    # Load Webhook URL
-                    self.webhook_url = config.get('webhook', {}).get('url', '')
-                    if not self.webhook_url:
-                        logging.warning("Webhook URL not found in config.json.")
-
-                    logging.info("Configuration loaded successfully.")
+                config = load_json_cached(config_path)
+                self.apply_config(config)
+                if not self.webhook_url:
+                    logging.warning("Webhook URL not found in config.json.")
+
+                logging.info("Configuration loaded successfully from %s.", config_path)
             except json.JSONDecodeError as e:
                 logging.error(f"Error parsing config.json: {e}")
                 QMessageBox.critical(self, "Configuration Error", "Failed to parse config.json. Please check the file format.")
@@ -878,8 +1407,8 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             
             if os.path.exists(template_path):
                 try:
-                    with open(template_path, 'r') as template_file:
-                        loaded_config = json.load(template_file)
+                    with open(template_path, 'rb') as template_file:
+                        loaded_config = json_loads(template_file.read())
                         # Merge with default_config to ensure all keys exist
                         for key, value in default_config.items():
                             if key not in loaded_config:
@@ -894,19 +1423,11 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 
             # Now create the config file with either template or default values
             try:
-                with open(config_path, 'w') as config_file:
-                    json.dump(default_config, config_file, indent=4)
+                write_json_cached(config_path, default_config)
                 logging.info(f"Default config.json created at {config_path}")
                 
                 # Set initial values from default config
-                self.bot_token = default_config.get('telegram', {}).get('bot_token', '')
-                self.chat_id = default_config.get('telegram', {}).get('chat_id', '')
-                self.message_thread_id = default_config.get('telegram', {}).get('message_thread_id', '')
-                self.webhook_url = default_config.get('webhook', {}).get('url', '')
-                self.github_token = default_config.get('github', {}).get('personal_access_token', '')
-                self.github_owner = default_config.get('github', {}).get('owner', '')
-                self.github_repo = default_config.get('github', {}).get('repo', '')
-                self.preferred_music_player = default_config.get('application', {}).get('preferred_music_player', 'Spotify')
+                self.apply_config(default_config)
                 
                 # Show a dialog to the user
                 msg_box = QMessageBox(self)
@@ -939,14 +1460,26 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 # Set built-in defaults even if we couldn't save them
                 self.preferred_music_player = 'Spotify'
 
+    def apply_config(self, config):
+        """Copy the values listed in CONFIG_FIELDS from a parsed config onto the window."""
+        for attr, dotted, default in CONFIG_FIELDS:
+            setattr(self, attr, config_get(config, dotted, default))
+
     def toggle_show_positions(self):
         # Get the current state from the action (checked or unchecked)
         show_positions = self.show_positions_action.isChecked()
         
         # Update the vertical header visibility based on the toggle state
         v_header = self.album_table.verticalHeader()
-        if v_header:
-            v_header.setVisible(show_positions)
+        if v_header is not None:
+            self.show_positions = show_positions
+            if (not v_header.isHidden()) != show_positions:
+                # Repaint the table once, after the header has been shown or hidden
+                self.album_table.setUpdatesEnabled(False)
+                try:
+                    v_header.setVisible(show_positions)
+                finally:
+                    self.album_table.setUpdatesEnabled(True)
         else:
             logging.warning("Could not toggle vertical header visibility: vertical header is None.")
         
@@ -967,21 +1500,31 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         dialog.exec()
 
     def check_for_updates(self):
+        """Fetch the latest GitHub release in a worker thread; results go to on_latest_release_fetched."""
         # Ensure that GitHub owner and repo are set
         if not all([self.github_owner, self.github_repo]):
             logging.warning("GitHub owner or repository name is missing. Aborting update check.")
-            return True  # Proceed to show the main window
+            return
 
         logging.debug("Starting update check...")
+        url = f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/releases/latest"
+        self.update_check_worker = Worker(self.get_latest_github_release, url, self.http_cache.get(url))
+        self.update_check_worker.finished.connect(self.on_latest_release_fetched)
+        self.update_check_worker.start()
+
+    def on_latest_release_fetched(self, fetched):
+        """Compare the fetched release with the running version and offer the update."""
+        release, cache_update = fetched
+        self.store_github_result(cache_update)
+
         current_version = self.version
         logging.debug(f"Current application version: {current_version}")
 
-        latest_version, download_url, release_notes_url = self.get_latest_github_release()
+        latest_version, download_url, release_notes_url = release
 
         if latest_version:
             try:
-                from packaging import version
-                if version.parse(latest_version) > version.parse(current_version):
+                if is_newer_version(latest_version, current_version):
                     logging.info(f"A new version {latest_version} is available.")
                     if download_url:
                         update_dialog = UpdateDialog(latest_version, current_version, release_notes_url)
@@ -990,7 +1533,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                         if reply == QDialog.DialogCode.Accepted:
                             logging.info("User accepted the update. Initiating download.")
                             self.download_and_install_update(download_url)
-                            return False  # Do not show the main window as update is being downloaded
+                            return  # The application exits once the download finishes
                         else:
                             logging.info("User declined the update.")
                     else:
@@ -1007,15 +1550,69 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         else:
             logging.error("Failed to retrieve the latest version information from GitHub.")
 
-        return True  # Proceed to show the main window
+        # Also check for genre definition updates, but with a slight delay
+        # to avoid too many operations at startup
+        QTimer.singleShot(2000, self.check_for_genre_updates)
 
-    def get_latest_github_release(self):
-        url = f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/releases/latest"
+    def fetch_github(self, url, cached=None, headers=None):
+        """
+        GET a GitHub API URL, revalidating against the ETag saved from the last call.
+
+        Args:
+            cached (dict, optional): The url's entry from self.http_cache, read on
+                the GUI thread before the worker started
+
+        Returns:
+            requests.Response or None: The response, or None if GitHub answered
+            304 Not Modified and the result in cached is still valid.
+        """
+        headers = {"Accept": "application/vnd.github+json", **(headers or {})}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+
+        response = self._http_session.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            logging.debug(f"GitHub resource not modified: {url}")
+            return None
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def github_cache_entry(url, response, result):
+        """
+        Pair the result derived from a GitHub response with its ETag. Workers
+        return this to the GUI thread, which stores it with store_github_result.
+        """
+        etag = response.headers.get('ETag')
+        if etag:
+            return url, {'etag': etag, 'result': result}
+        return None
+
+    def store_github_result(self, cache_update):
+        """Remember a (url, entry) pair from github_cache_entry. Runs on the GUI thread."""
+        if cache_update:
+            url, entry = cache_update
+            self.http_cache[url] = entry
+
+    def get_latest_github_release(self, url, cached=None):
+        """
+        Fetch the latest release. Runs off the GUI thread.
+
+        Returns:
+            tuple: ((latest_version, download_url, release_notes_url), cache_update)
+        """
         try:
             logging.debug(f"Fetching latest release from URL: {url}")
-            response = requests.get(url)
-            response.raise_for_status()
-            release_info = response.json()
+            headers = {}
+            if self.github_token:
+                # Authenticated requests get a much higher rate limit
+                headers["Authorization"] = f"token {self.github_token}"
+            response = self.fetch_github(url, cached, headers=headers)
+            if response is None:
+                latest_version, download_url, release_notes_url = cached['result']
+                logging.debug(f"Using cached release information for {latest_version}")
+                return (latest_version, download_url, release_notes_url), None
+            release_info = json_loads(response.content)
             
             latest_version = release_info.get('tag_name')
             assets = release_info.get('assets', [])
@@ -1024,55 +1621,89 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             logging.debug(f"Latest Version: {latest_version}")
             logging.debug(f"Number of assets found: {len(assets)}")
             
-            download_url = None
-            for asset in assets:
-                if asset['name'].endswith('.exe'):
-                    download_url = asset.get('browser_download_url')
-                    logging.debug(f"Found executable asset: {asset['name']}")
-                    break
+            download_url = next(
+                (asset.get('browser_download_url') for asset in assets if asset['name'].endswith('.exe')),
+                None
+            )
             
+            cache_update = self.github_cache_entry(url, response, [latest_version, download_url, release_notes_url])
+
             if download_url:
                 logging.info(f"Latest version {latest_version} found with executable asset.")
-                return latest_version, download_url, release_notes_url
             else:
                 logging.warning("No executable (.exe) asset found in the latest release.")
-                return latest_version, None, release_notes_url
+            return (latest_version, download_url, release_notes_url), cache_update
         except requests.exceptions.RequestException as e:
             logging.error(f"Error fetching latest release: {e}")
-            return None, None, None
+            return (None, None, None), None
         except ValueError as e:
             logging.error(f"Error parsing JSON response: {e}")
-            return None, None, None
+            return (None, None, None), None
 
     def download_and_install_update(self, download_url):
-        self.progress_dialog = QProgressDialog("Downloading Update...", "Cancel", 0, 100, self)
-        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self.progress_dialog.canceled.connect(self.cancel_download)
-        self.progress_dialog.show()
-
-        self.download_thread = QThread()
+        # The download thread is created once and reused for later downloads
+        if self.download_thread is None:
+            self.download_thread = QThread(self)
+            app = QApplication.instance()
+            if app:
+                app.aboutToQuit.connect(self.stop_download_thread)
+            self.download_thread.start()
+
+        self.download_cancelled = False
         self.download_worker = DownloadWorker(download_url, self.github_token or "")
         self.download_worker.moveToThread(self.download_thread)
 
-        self.download_thread.started.connect(self.download_worker.start_download)
-        self.download_worker.progress_changed.connect(self.progress_dialog.setValue)
-        self.download_worker.download_finished.connect(self.on_download_finished)
-        self.download_worker.download_failed.connect(self.on_download_failed)
-
-        self.download_worker.download_finished.connect(self.download_thread.quit)
-        self.download_worker.download_failed.connect(self.download_thread.quit)
-        self.download_worker.download_finished.connect(self.download_worker.deleteLater)
-        self.download_worker.download_failed.connect(self.download_worker.deleteLater)
-        self.download_thread.finished.connect(self.download_thread.deleteLater)
-
-        self.download_thread.start()
+        queued = Qt.ConnectionType.QueuedConnection
+        for signal, slot in (
+            (self.download_worker.progress_changed, self.on_download_progress),
+            (self.download_worker.download_finished, self.on_download_finished),
+            (self.download_worker.download_failed, self.on_download_failed),
+            (self.download_worker.download_cancelled, self.on_download_cancelled),
+            (self.download_worker.download_finished, self.download_worker.deleteLater),
+            (self.download_worker.download_failed, self.download_worker.deleteLater),
+            (self.download_worker.download_cancelled, self.download_worker.deleteLater),
+        ):
+            signal.connect(slot, queued)
+
+        # The progress dialog is only created once the first chunk arrives
+        self.statusBar().showMessage("Downloading update...")
+        QMetaObject.invokeMethod(self.download_worker, "start_download", queued)
+
+    def on_download_progress(self, value):
+        # Progress still queued from a cancelled download must not reopen the dialog
+        if self.download_cancelled:
+            return
+        if self.progress_dialog is None:
+            self.progress_dialog = QProgressDialog("Downloading Update...", "Cancel", 0, 100, self)
+            self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            self.progress_dialog.canceled.connect(self.cancel_download)
+            self.progress_dialog.show()
+        self.progress_dialog.setValue(value)
+
+    def close_download_progress(self):
+        self.statusBar().clearMessage()
+        if self.progress_dialog is not None:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+    def stop_download_thread(self):
+        if self.download_thread is not None:
+            self.download_thread.quit()
+            self.download_thread.wait()
 
     def cancel_download(self):
-        if hasattr(self, 'download_worker') and self.download_worker:
+        self.download_cancelled = True
+        if self.download_worker is not None:
             self.download_worker.is_cancelled = True
+        self.close_download_progress()
+
+    def on_download_cancelled(self):
+        self.download_worker = None
+        self.close_download_progress()
+        logging.info("Update download cancelled.")
 
     def on_download_finished(self, file_path):
-        self.progress_dialog.close()
+        self.close_download_progress()
         # Launch the installer
         try:
             if sys.platform.startswith('win'):
@@ -1088,48 +1719,87 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             QApplication.quit()  # Exit the application after launching the installer
 
     def on_download_failed(self, error_message):
-        self.progress_dialog.close()
+        self.download_worker = None
+        self.close_download_progress()
         QMessageBox.critical(self, "Download Failed", f"Failed to download update: {error_message}")
 
     def check_for_genre_updates(self):
         """
-        Check if there is a newer version of genres.txt on GitHub.
-        If so, prompt the user to update.
+        Check in a worker thread if there is a newer version of genres.txt on GitHub.
+        If so, on_genre_changes_fetched prompts the user to update.
         """
         if not all([self.github_owner, self.github_repo]):
             logging.warning("GitHub owner or repository name is missing. Cannot check for genre updates.")
             return
         
+        url = f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/contents/genres.txt"
+        self.genre_check_worker = Worker(self.fetch_genre_changes, url, self.http_cache.get(url))
+        self.genre_check_worker.finished.connect(self.on_genre_changes_fetched)
+        self.genre_check_worker.start()
+
+    def fetch_genre_changes(self, url, cached=None):
+        """
+        Compare the remote genres.txt with the local copy. Runs off the GUI thread.
+
+        The http_cache entry only holds the remote file's SHA; its body is kept
+        in its own file (GENRES_REMOTE_CACHE) rather than in settings.json.
+
+        Returns:
+            tuple: (changes, cache_update), where changes is (added_genres,
+            removed_genres, remote_content, remote_sha), or None if there is
+            nothing to update.
+        """
+        cache_update = None
         try:
             # Get the content of the remote genres.txt file
-            url = f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/contents/genres.txt"
             headers = {}
             if self.github_token:
                 headers["Authorization"] = f"token {self.github_token}"
             
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            remote_file_info = response.json()
-            remote_content = base64.b64decode(remote_file_info["content"]).decode("utf-8")
-            remote_sha = remote_file_info["sha"]
+            body_path = self.get_user_data_path(self.GENRES_REMOTE_CACHE, packaged=IS_PACKAGED)
+            response = self.fetch_github(url, cached, headers=headers)
+            if response is None:
+                remote_data = None  # Read from body_path only if it's needed
+                remote_sha = cached['result']['sha']
+            else:
+                remote_file_info = json_loads(response.content)
+                remote_data = base64.b64decode(remote_file_info["content"])
+                remote_sha = remote_file_info["sha"]
+                cache_update = self.github_cache_entry(url, response, {'sha': remote_sha})
+                try:
+                    atomic_write_bytes(body_path, remote_data)
+                except OSError as e:
+                    logging.warning(f"Could not cache the remote genres.txt: {e}")
             
             # Get the local file info
             local_path = resource_path("genres.txt")
             if not os.path.exists(local_path):
                 logging.error(f"Local genres.txt not found at {local_path}")
-                return
-            
-            with open(local_path, 'r', encoding='utf-8') as f:
-                local_content = f.read()
+                return None, cache_update
             
-            # Calculate SHA of local file for comparison
-            local_sha = hashlib.sha1(local_content.encode()).hexdigest()
+            # Calculate SHA of the raw local bytes for comparison
+            local_data = Path(local_path).read_bytes()
+            local_sha = git_blob_sha(local_data)
             
             # If files are identical, no update needed
             if local_sha == remote_sha:
                 logging.info("Genres.txt is up to date.")
-                return
+                return None, cache_update
+            
+            if remote_data is None:
+                try:
+                    with open(body_path, 'rb') as f:
+                        remote_data = f.read()
+                except OSError:
+                    remote_data = b''
+                if git_blob_sha(remote_data) != remote_sha:
+                    # The cached body is missing or stale; fetch the file in full
+                    logging.debug("Cached genres.txt body is out of date, refetching.")
+                    return self.fetch_genre_changes(url)
+            remote_content = remote_data.decode('utf-8')
+            
+            # Only decode the local file when the contents actually differ
+            local_content = local_data.decode('utf-8')
             
             # Compare the genre lists
             local_genres = set(line.strip() for line in local_content.splitlines() if line.strip())
@@ -1142,51 +1812,70 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             if not added_genres and not removed_genres:
                 # Files differ but no actual genre changes (maybe just whitespace or order)
                 logging.info("No actual changes in genres.txt content, skipping update.")
-                return
+                return None, cache_update
             
-            # Show dialog with changes and ask for confirmation
-            dialog = GenreUpdateDialog(added_genres, removed_genres, self)
-            result = dialog.exec()
-            
-            if result == QDialog.DialogCode.Accepted:
-                # User confirmed update, apply it
-                self.apply_genre_update(remote_content)
+            return (added_genres, removed_genres, remote_content, remote_sha), cache_update
                 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error checking for genre updates: {e}")
         except Exception as e:
             logging.error(f"Unexpected error checking for genre updates: {e}")
+        return None, cache_update
 
-    def apply_genre_update(self, new_content):
+    def on_genre_changes_fetched(self, fetched):
+        """Show the fetched genre changes and apply them if the user confirms."""
+        changes, cache_update = fetched
+        self.store_github_result(cache_update)
+        if not changes:
+            return
+        added_genres, removed_genres, remote_content, remote_sha = changes
+        
+        # Show dialog with changes and ask for confirmation
+        dialog = GenreUpdateDialog(added_genres, removed_genres, self)
+        result = dialog.exec()
+        
+        if result == QDialog.DialogCode.Accepted:
+            # User confirmed update, apply it
+            self.apply_genre_update(remote_content, remote_sha)
+
+    def apply_genre_update(self, new_content, new_sha=None):
         """
         Apply an update to the genres.txt file and reload genres.
         
         Args:
             new_content (str): The new content for genres.txt
+            new_sha (str, optional): Git blob SHA of new_content, if already known
         """
         try:
             local_path = resource_path("genres.txt")
+            new_data = new_content.encode('utf-8')
+            if new_sha is None:
+                new_sha = git_blob_sha(new_data)
+            
+            # Nothing to back up or write if the content is unchanged
+            if os.path.exists(local_path) and git_blob_sha(Path(local_path).read_bytes()) == new_sha:
+                logging.info("genres.txt already matches the update, skipping write.")
+                return
+            
+            # Write the new content next to the file, then move the old file
+            # to the backup and the new one into place (renames, not copies)
+            tmp_path = f"{local_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(new_data)
             
-            # Create a backup first
             backup_path = f"{local_path}.bak"
             if os.path.exists(local_path):
-                shutil.copy2(local_path, backup_path)
+                os.replace(local_path, backup_path)
                 logging.info(f"Created backup of genres.txt at {backup_path}")
-            
-            # Write the new content
-            with open(local_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            os.replace(tmp_path, local_path)
             
             logging.info("Updated genres.txt successfully")
             
-            # Reload the genres
-            self.genres = read_file_lines('genres.txt', transform=lambda lines: {line.title() for line in lines})
-            
-            # Update any genre delegates that exist
-            if hasattr(self, 'genre_delegate_1') and self.genre_delegate_1:
-                self.genre_delegate_1.items = self.genres
-            if hasattr(self, 'genre_delegate_2') and self.genre_delegate_2:
-                self.genre_delegate_2.items = self.genres
+            # Reload the genres in the background; the delegates are updated
+            # from on_genres_reloaded once the list is ready
+            self.genre_reload_worker = Worker(load_genres)
+            self.genre_reload_worker.finished.connect(self.on_genres_reloaded)
+            self.genre_reload_worker.start()
                 
             # Show success message
             QMessageBox.information(self, "Genres Updated", 
@@ -1197,50 +1886,54 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             QMessageBox.critical(self, "Update Failed", 
                                 f"Failed to update genres: {e}")
 
+    def on_genres_reloaded(self, genres):
+        """Install a freshly loaded genre list on the window and the genre delegates."""
+        self.genres = genres
+        
+        # Update any genre delegates that exist
+        if hasattr(self, 'genre_delegate') and self.genre_delegate:
+            self.genre_delegate.items = self.genres
+
     def load_settings(self):
-        is_packaged = getattr(sys, 'frozen', False)
-        settings_path = self.get_user_data_path('settings.json', packaged=is_packaged)
+        settings_path = self.get_user_data_path('settings.json', packaged=IS_PACKAGED)
 
         if os.path.exists(settings_path):
             try:
-                with open(settings_path, 'r') as file:
-                    settings = json.load(file)
-                    self.last_opened_file = settings.get('last_opened_file', None)
-                    self.recent_files = settings.get('recent_files', [])
+                settings = load_json_cached(settings_path)
+                self.last_opened_file = settings.get('last_opened_file', None)
+                self.recent_files = deque(settings.get('recent_files', []), maxlen=self.MAX_RECENT_FILES)
+                # Drop entries from older versions that embedded the whole response body
+                self.http_cache = {
+                    url: entry for url, entry in settings.get('http_cache', {}).items()
+                    if not (isinstance(entry.get('result'), dict) and 'content' in entry['result'])
+                }
             except json.JSONDecodeError as e:
                 logging.error(f"Error parsing settings.json: {e}")
                 self.last_opened_file = None
-                self.recent_files = []
+                self.recent_files = deque(maxlen=self.MAX_RECENT_FILES)
         else:
             # This is a fresh install or settings have been deleted
             self.last_opened_file = None
-            self.recent_files = []
+            self.recent_files = deque(maxlen=self.MAX_RECENT_FILES)
 
     def save_settings(self):
-        is_packaged = getattr(sys, 'frozen', False)
-        logging.debug(f"Application is packaged: {is_packaged}")
-        settings_path = self.get_user_data_path('settings.json', packaged=is_packaged)
-        logging.debug(f"Saving settings to: {settings_path}")
+        settings_path = self.get_user_data_path('settings.json', packaged=IS_PACKAGED)
 
         settings = {
             'last_opened_file': self.current_file_path,
-            'recent_files': self.recent_files,
+            'recent_files': list(self.recent_files),
+            'http_cache': dict(self.http_cache),
         }
 
         try:
-            with open(settings_path, 'w') as file:
-                json.dump(settings, file, indent=4)
-            logging.info(f"Settings saved successfully to {settings_path}")
+            write_json_cached(settings_path, settings)
+            logging.info("Settings saved successfully to %s (packaged: %s)", settings_path, IS_PACKAGED)
         except Exception as e:
             logging.error(f"Failed to save settings: {e}")
 
     def get_app_version(self):
         try:
-            version_file = resource_path('version.txt')
-            logging.info(f"Looking for version file at: {version_file}")
-            with open(version_file, 'r') as f:
-                version = f.read().strip()
-            return version
+            return read_app_version()
         except Exception as e:
             logging.error(f"Error reading version.txt: {e}")
             return "Unknown"
@@ -1258,15 +1951,24 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             self.notification_image_label.move(self.notification_label.x() - 75, 50)  # Position the image to the left of the text
             self.notification_image_label.show()
 
-        QTimer.singleShot(2000, self.notification_label.hide)
-        QTimer.singleShot(2000, self.notification_image_label.hide)
+        self.notification_timer.start(2000)  # Restarts the countdown if already running
+
+    def hide_notification(self):
+        self.notification_label.hide()
+        self.notification_image_label.hide()
 
     def show_search_bar(self):
         if not hasattr(self, 'search_widget'):
             self.search_bar = QLineEdit(self)
             self.search_bar.setPlaceholderText("Search...")
             self.search_bar.returnPressed.connect(self.goto_next_match)
-            self.search_bar.textChanged.connect(self.search_album_list)
+
+            # Coalesce rapid keystrokes into a single search
+            self.search_timer = QTimer(self)
+            self.search_timer.setSingleShot(True)
+            self.search_timer.setInterval(50)
+            self.search_timer.timeout.connect(self.search_album_list)
+            self.search_bar.textChanged.connect(self.search_timer.start)
 
             # 'Next' and 'Previous' buttons
             self.search_prev_button = QPushButton("Previous")
@@ -1302,8 +2004,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.search_bar.clear()
         # Clear search text in all delegates
         self.search_delegate.set_search_text("")
-        self.genre_delegate_1.set_search_text("")
-        self.genre_delegate_2.set_search_text("")
+        self.genre_delegate.set_search_text("")
         # Clear matches
         self.matches = []
         self.current_match_index = -1
@@ -1315,8 +2016,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
     def search_album_list(self):
         search_text = self.search_bar.text().strip().lower()
         self.search_delegate.set_search_text(search_text)
-        self.genre_delegate_1.set_search_text(search_text)
-        self.genre_delegate_2.set_search_text(search_text)
+        self.genre_delegate.set_search_text(search_text)
 
         self.matches = []
 
@@ -1324,32 +2024,90 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             self.current_match_index = -1
             return
 
+        # Find matches in the prebuilt lowercase index
+        if self._search_index is None:
+            self._search_index = self.build_search_index()
+            self._search_blob = None
+            self._last_search = ('', [])
+        last_text, last_entries = self._last_search
+        if last_text and search_text.startswith(last_text):
+            # A longer query can only match cells the shorter one matched
+            entries = [entry for entry in last_entries if search_text in entry[2]]
+        elif len(self._search_index) >= self.SEARCH_BLOB_THRESHOLD:
+            entries = self.search_blob_matches(search_text)
+        else:
+            entries = [entry for entry in self._search_index if search_text in entry[2]]
+        self._last_search = (search_text, entries)
+        self.matches = [(row, column) for row, column, _ in entries]
+
+        self.current_match_index = -1
+        if self.matches:
+            self.goto_next_match()
+
+    def build_search_index(self):
+        """Build the list of (row, column, lowercase text) entries searched by search_album_list."""
         # Columns to search - don't use range(self.album_table.columnCount())
         # Instead use specific column constants from the model
         columns_to_search = [AlbumModel.ARTIST, AlbumModel.ALBUM, 
                             AlbumModel.GENRE_1, AlbumModel.GENRE_2, 
                             AlbumModel.COMMENTS]
+        column_keys = [(column, self.album_model.get_column_key(column)) for column in columns_to_search]
 
-        # Find matches
-        for row in range(self.album_model.rowCount()):
-            for column in columns_to_search:
-                item_text = ""
-                # Use model data instead of table items
-                data = self.album_model.data(self.album_model.index(row, column), Qt.ItemDataRole.DisplayRole)
+        search_index = []
+        for row, album in enumerate(self.album_model.album_data):
+            for column, key in column_keys:
+                data = album.get(key)
                 if data:
-                    item_text = str(data).lower()
+                    search_index.append((row, column, str(data).lower()))
+        return search_index
 
-                if search_text in item_text:
-                    self.matches.append((row, column))
+    def search_blob_matches(self, search_text):
+        """
+        Find the matching index entries for large lists by scanning one
+        NUL-separated bytes buffer of all indexed cells with bytes.find,
+        which runs at memchr speed.
+        """
+        if self._search_blob is None:
+            encoded = [text.encode('utf-8') for _, _, text in self._search_index]
+            starts = []
+            offset = 0
+            for cell in encoded:
+                starts.append(offset)
+                offset += len(cell) + 1
+            self._search_blob = b'\0'.join(encoded)
+            self._search_starts = starts
+
+        needle = search_text.encode('utf-8')
+        blob = self._search_blob
+        starts = self._search_starts
+        matches = []
+        pos = blob.find(needle)
+        while pos >= 0:
+            entry = bisect.bisect_right(starts, pos) - 1
+            matches.append(self._search_index[entry])
+            # Continue with the next cell so each cell matches at most once
+            if entry + 1 >= len(starts):
+                break
+            pos = blob.find(needle, starts[entry + 1])
+        return matches
 
-        self.current_match_index = -1
-        if self.matches:
-            self.goto_next_match()
+    def invalidate_search_index(self, *args):
+        """Drop the search index; it is rebuilt on the next search."""
+        self._search_index = None
+        self._search_blob = None
+        self._last_search = ('', [])
 
     def goto_next_match(self):
+        self._goto_match(1)
+
+    def goto_previous_match(self):
+        self._goto_match(-1)
+
+    def _goto_match(self, delta):
+        """Move delta matches forward or backward and scroll to/select that cell."""
         if not self.matches:
             return
-        self.current_match_index = (self.current_match_index + 1) % len(self.matches)
+        self.current_match_index = (self.current_match_index + delta) % len(self.matches)
         row, column = self.matches[self.current_match_index]
         model_index = self.album_model.index(row, column) # Get the model index
         self.album_table.scrollTo(model_index, QTableView.ScrollHint.PositionAtCenter) # Use model index for scrolling
@@ -1364,14 +2122,6 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         else:
             logging.warning("Selection model not available for album table.")
 
-    def goto_previous_match(self):
-        if not self.matches:
-            return
-        self.current_match_index = (self.current_match_index - 1) % len(self.matches)
-        row, column = self.matches[self.current_match_index]
-        self.album_table.scrollToItem(self.album_table.item(row, column) or self.album_table.item(row, 0), QAbstractItemView.ScrollHint.PositionAtCenter)
-        self.album_table.setCurrentCell(row, column)
-
     def show_about_dialog(self):
         version = self.get_app_version()
         about_text = f"""
@@ -1395,6 +2145,10 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         """
         self.recent_files_menu.clear()
         
+        # Drop files that no longer exist in a single pass
+        self.recent_files = deque((file_path for file_path in self.recent_files if os.path.exists(file_path)),
+                                  maxlen=self.MAX_RECENT_FILES)
+        
         # If no recent files, add a disabled "No recent files" entry
         if not self.recent_files:
             no_files_action = QAction("No recent files", self)
@@ -1402,42 +2156,52 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             self.recent_files_menu.addAction(no_files_action)
             return
         
+        # Grow the pool of reusable actions if needed; all of them are
+        # dispatched through the menu's triggered signal
+        while len(self.recent_file_actions) < len(self.recent_files):
+            self.recent_file_actions.append(QAction(self))
+        
         # Add each recent file as a menu item
-        for index, file_path in enumerate(self.recent_files):
-            if os.path.exists(file_path):
-                # Get just the filename for display
-                file_name = os.path.basename(file_path)
-                
-                # Create action with shortened display name and full path tooltip
-                action = QAction(file_name, self)
-                action.setToolTip(file_path)
+        for index, (file_path, action) in enumerate(zip(self.recent_files, self.recent_file_actions)):
+            # Show just the filename, with the full path as data and tooltip
+            action.setText(os.path.basename(file_path))
+            action.setToolTip(file_path)
+            action.setData(file_path)
+            
+            # Add a checkmark if this is the current file
+            is_current = file_path == self.current_file_path
+            action.setCheckable(is_current)
+            action.setChecked(is_current)
+            
+            # Add keyboard shortcut for the first 9 items (Ctrl+1 through Ctrl+9)
+            action.setShortcut(f"Ctrl+{index+1}" if index < 9 else "")
                 
-                # Connect to the loading function
-                action.triggered.connect(partial(self.trigger_load_album_data, file_path))
-                
-                # Add a checkmark if this is the current file
-                if file_path == self.current_file_path:
-                    action.setCheckable(True)
-                    action.setChecked(True)
-                
-                # Add keyboard shortcut for the first 9 items (Ctrl+1 through Ctrl+9)
-                if index < 9:
-                    action.setShortcut(f"Ctrl+{index+1}")
-                    
-                self.recent_files_menu.addAction(action)
+            self.recent_files_menu.addAction(action)
+
+    def on_recent_file_triggered(self, action):
+        """Single dispatch slot for the Recent Files menu."""
+        file_path = action.data() if action else None
+        if file_path:
+            self.trigger_load_album_data(file_path)
 
     def show_help(self):
         help_file_path = resource_path('help.md')
         if os.path.exists(help_file_path):
             try:
-                with open(help_file_path, 'r', encoding='utf-8') as file:
-                    markdown_text = file.read()
-                    # Convert markdown to HTML
-                    import markdown
-                    html_content = markdown.markdown(markdown_text)
-                    # Display the HTML content in a HelpDialog
-                    help_dialog = HelpDialog(html_content, self)
-                    help_dialog.exec()
+                # Only re-read and re-convert help.md when it has changed
+                mtime = os.stat(help_file_path).st_mtime_ns
+                if self._help_html_cache is None or mtime != self._help_html_mtime:
+                    with open(help_file_path, 'r', encoding='utf-8') as file:
+                        markdown_text = file.read()
+                    # Convert markdown to HTML, reusing a single converter
+                    if self._markdown is None:
+                        import markdown
+                        self._markdown = markdown.Markdown(extensions=[], output_format='html')
+                    self._help_html_cache = self._markdown.reset().convert(markdown_text)
+                    self._help_html_mtime = mtime
+                # Display the HTML content in a HelpDialog
+                help_dialog = HelpDialog(self._help_html_cache, self)
+                help_dialog.exec()
             except Exception as e:
                 logging.error(f"Error reading help file: {e}")
                 QMessageBox.warning(self, "Error", "An error occurred while reading the help file.")
@@ -1449,9 +2213,6 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.close()
 
     def setup_tabs(self):
-        from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton
-        from PyQt6.QtCore import Qt
-        
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
@@ -1480,7 +2241,9 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         # Set the corner widget
         self.tabs.setCornerWidget(corner_widget, Qt.Corner.TopRightCorner)
 
-        # Setup tab content (only album list)
+        # Setup tab content (only album list). This is the window's only tab and
+        # is visible at startup, so it is built eagerly; the settings and album
+        # search UIs are dialogs that are only constructed when opened.
         self.setup_album_list_tab()
 
     def open_search_dialog(self):
@@ -1502,7 +2265,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.trigger_save_album_data()
+                self.trigger_save_album_data(wait=True)
             elif reply == QMessageBox.StandardButton.Cancel:
                 return  # Abort submission
             # If No, proceed without saving
@@ -1522,57 +2285,36 @@ class SpotifyAlbumAnalyzer(QMainWindow):
 
     def get_user_data_path(self, filename, packaged=False):
         """Get a path to the user-specific application data directory for storing the given filename."""
-        app_name = 'SuSheApp'
-
-        if sys.platform == 'win32':
-            appdata = os.getenv('APPDATA')
-            if appdata is not None:
-                app_data_dir = os.path.join(appdata, app_name)
-            else:
-                app_data_dir = os.path.join(os.path.expanduser('~'), app_name)
-        elif sys.platform == 'darwin':
-            app_data_dir = os.path.join(os.path.expanduser('~/Library/Application Support/'), app_name)
-        else:  # Linux and other Unix-like OSes
-            app_data_dir = os.path.join(os.path.expanduser('~'), '.SuSheApp')
-
-        if packaged:
-            # Use a subdirectory for packaged application settings
-            app_data_dir = os.path.join(app_data_dir, 'packaged')
-
-        if not os.path.exists(app_data_dir):
-            os.makedirs(app_data_dir)  # Ensure directory is created
-
-        return os.path.join(app_data_dir, filename)
+        return os.path.join(user_data_dir(packaged), filename)
 
     def on_layout_changed(self):
             """Called when the album model layout changes due to operations like drag-and-drop."""
             # Update main window's dataChanged flag from the model
             self.dataChanged = self.album_model.is_modified
-            self.update_window_title()
+            self.title_timer.start()
             logging.info("Album layout changed (reordering). Change state: %s", self.dataChanged)
 
     def import_config(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import Config", "", "JSON Files (*.json)"
+            self, "Import Config", "", "JSON Files (*.json)", options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             logging.debug(f"Selected config file for import: {file_path}")
             try:
-                with open(file_path, 'r') as file:
-                    new_config = json.load(file)
+                with open(file_path, 'rb') as file:
+                    new_config = json_loads(file.read())
                 logging.debug("Config file loaded successfully.")
 
                 config_path = self.get_user_data_path('config.json')
                 logging.debug(f"Importing config to: {config_path}")
 
-                with open(config_path, 'w') as file:
-                    json.dump(new_config, file, indent=4)
+                write_json_cached(config_path, new_config)
                 logging.info("Configuration imported successfully.")
 
                 self.load_config()
                 logging.debug("Configuration reloaded after import.")
 
-                QTimer.singleShot(0, lambda: self.statusBar().showMessage("Configuration imported successfully.", 5000))
+                QTimer.singleShot(0, partial(self.statusBar().showMessage, "Configuration imported successfully.", 5000))
                 logging.debug("Status bar message scheduled.")
 
                 # Open settings dialog instead of navigating to settings tab
@@ -1626,36 +2368,27 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         
         # Configure vertical header (row numbers)
         v_header = self.album_table.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setDefaultSectionSize(100)  # Consistent row height
             v_header.setVisible(self.show_positions)  # Set based on preference
             v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)  # Prevent resizing
             v_header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the numbers
-            v_header.setMinimumWidth(30)  # Give enough space for double-digit numbers
+            v_header.setMinimumWidth(self.V_HEADER_MIN_WIDTH)
+            v_header.setStyleSheet(V_HEADER_QSS)
         else:
             logging.warning("Vertical header not available for album table.")
-        v_header.setStyleSheet("""
-            QHeaderView::section:vertical {
-                background-color: #1A1A1A;
-                color: #1DB954;  /* Spotify green */
-                font-weight: bold;
-                border: none;
-                border-right: 1px solid #333333;
-                padding: 4px;
-            }
-        """)
         
-        # Create separate delegate instances properly parented to the view
+        # Create delegate instances properly parented to the view; both genre
+        # columns are configured identically and share one delegate
         country_delegate = ComboBoxDelegate(self.countries, self.album_table)
-        self.genre_delegate_1 = GenreSearchDelegate(self.genres, self.album_table, highlight_color=Qt.GlobalColor.darkYellow)
-        self.genre_delegate_2 = GenreSearchDelegate(self.genres, self.album_table, highlight_color=Qt.GlobalColor.darkYellow)
+        self.genre_delegate = GenreSearchDelegate(self.genres, self.album_table, highlight_color=Qt.GlobalColor.darkYellow)
         self.search_delegate = SearchHighlightDelegate(self.album_table, highlight_color=Qt.GlobalColor.darkYellow)
         cover_delegate = CoverImageDelegate(self.album_table)
 
         # Assign delegates to respective columns
         self.album_table.setItemDelegateForColumn(AlbumModel.COUNTRY, country_delegate)
-        self.album_table.setItemDelegateForColumn(AlbumModel.GENRE_1, self.genre_delegate_1)
-        self.album_table.setItemDelegateForColumn(AlbumModel.GENRE_2, self.genre_delegate_2)
+        self.album_table.setItemDelegateForColumn(AlbumModel.GENRE_1, self.genre_delegate)
+        self.album_table.setItemDelegateForColumn(AlbumModel.GENRE_2, self.genre_delegate)
         self.album_table.setItemDelegateForColumn(AlbumModel.COVER_IMAGE, cover_delegate)
 
         # Set the search highlight delegate for specified columns
@@ -1667,9 +2400,25 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.album_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.album_table.customContextMenuRequested.connect(self.show_context_menu)
 
-        # Connect model change signals to update UI state
-        self.album_model.dataChanged.connect(self.on_album_data_changed)
-        self.album_model.layoutChanged.connect(self.on_layout_changed)
+        # Built once and reused by every right-click
+        self.album_context_menu = QMenu(self)
+        self.remove_album_action = self.album_context_menu.addAction("Remove Album")
+        self.open_album_action = self.album_context_menu.addAction("Open Album")
+
+        # Connect model change signals to update UI state and keep the search
+        # index in sync. The model lives on the GUI thread, so these are wired
+        # as direct connections to skip the auto-connection thread check.
+        direct = Qt.ConnectionType.DirectConnection
+        for signal, slot in (
+            (self.album_model.dataChanged, self.on_album_data_changed),
+            (self.album_model.layoutChanged, self.on_layout_changed),
+            (self.album_model.dataChanged, self.invalidate_search_index),
+            (self.album_model.layoutChanged, self.invalidate_search_index),
+            (self.album_model.rowsInserted, self.invalidate_search_index),
+            (self.album_model.rowsRemoved, self.invalidate_search_index),
+            (self.album_model.modelReset, self.invalidate_search_index),
+        ):
+            signal.connect(slot, direct)
         
         # Add to layout
         layout.addWidget(self.album_table)
@@ -1705,21 +2454,16 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             (AlbumModel.COMMENTS, 340),     # "Comments" column
         ]
         
-        # Apply column widths to both the header sections and table columns
-        if header:  # Check if header is not None
+        # Apply column widths through the header; setColumnWidth would just
+        # forward to resizeSection. Alignment was already set in setup_album_list_tab.
+        if header is not None:
+            # The header keeps emitting sectionResized here; the table relies on
+            # it to update its own geometry
             for column, width in column_widths:
-                self.album_table.setColumnWidth(column, width)
-                header.resizeSection(column, width)  # This ensures header width = column width
-            
-            # Lock column sizes after setting them
-            for i in range(self.album_model.columnCount()):
-                header.setSectionResizeMode(i, QHeaderView.ResizeMode.Fixed)
-            
-            # We can add a bit of extra styling to the header for better appearance
-            header.setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Update the visual properties of the headers to ensure they're refreshed
-            header.update()
+                header.resizeSection(column, width)
+
+            # Lock all column sizes at once
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         else:
             logging.error("Could not apply column widths because horizontal header is None.")
 
@@ -1735,26 +2479,6 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         Initiate Spotify login flow with improved error handling and state management.
         """
         logging.info("Starting Spotify login process")
-        
-        # Default client ID embedded in app
-        default_client_id = "2241ba6e592a4d60aa18c81a8507f0b3"
-        
-        # Ensure we have a SpotifyAuth instance
-        if not hasattr(self, 'spotify_auth'):
-            try:
-                from spotify_auth import SpotifyAuth
-                self.spotify_auth = SpotifyAuth(default_client_id)
-                
-                # Connect signals only once
-                self.spotify_auth.auth_complete.connect(self.on_spotify_auth_complete)
-                self.spotify_auth.auth_timeout.connect(self.on_spotify_auth_timeout)
-                
-                logging.info("Created new SpotifyAuth instance")
-            except Exception as e:
-                logging.error(f"Failed to create SpotifyAuth instance: {e}")
-                QMessageBox.critical(self, "Authentication Error", 
-                                f"Failed to initialize Spotify authentication: {e}")
-                return
 
         # Check if authentication is already in progress
         if hasattr(self, 'auth_progress') and self.auth_progress and self.auth_progress.isVisible():
@@ -1811,7 +2535,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 self.auth_progress = None
         
         if success:
-            if not hasattr(self, 'spotify_auth') or not self.spotify_auth.auth_code:
+            if not self.spotify_auth.auth_code:
                 logging.error("Auth success reported but no auth code available")
                 QMessageBox.warning(self, "Authentication Error", 
                                 "Authentication succeeded but no authorization code was received.")
@@ -1836,6 +2560,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 # Log if tokens were saved successfully
                 token_save_success = self.spotify_auth.save_tokens(tokens_path)
                 logging.info(f"Token save success: {token_save_success}")
+                self.schedule_token_refresh()
                 
                 QMessageBox.information(self, "Success", "Successfully logged in to Spotify.")
             else:
@@ -1863,11 +2588,10 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                 self.auth_progress = None
         
         # Clean up auth resources
-        if hasattr(self, 'spotify_auth'):
-            try:
-                self.spotify_auth.cleanup_auth_resources()
-            except Exception as e:
-                logging.error(f"Error cleaning up auth resources after timeout: {e}")
+        try:
+            self.spotify_auth.cleanup_auth_resources()
+        except Exception as e:
+            logging.error(f"Error cleaning up auth resources after timeout: {e}")
         
         # Show timeout message
         QMessageBox.warning(self, "Authentication Timeout", 
@@ -1879,12 +2603,11 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         """
         logging.info("Spotify authentication cancelled by user")
         
-        if hasattr(self, 'spotify_auth'):
-            try:
-                self.spotify_auth.cleanup_auth_resources()
-                logging.info("Auth resources cleaned up after cancellation")
-            except Exception as e:
-                logging.error(f"Error cleaning up after cancellation: {e}")
+        try:
+            self.spotify_auth.cleanup_auth_resources()
+            logging.info("Auth resources cleaned up after cancellation")
+        except Exception as e:
+            logging.error(f"Error cleaning up after cancellation: {e}")
         
         if hasattr(self, 'auth_progress') and self.auth_progress:
             self.auth_progress.close()
@@ -1896,8 +2619,8 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         """
         logging.info("Starting Spotify logout process")
         
-        if not hasattr(self, 'spotify_auth'):
-            logging.warning("Logout attempted but no SpotifyAuth instance exists")
+        if not self.spotify_auth.access_token and not self.spotify_auth.refresh_token:
+            logging.warning("Logout attempted but no Spotify tokens are loaded")
             QMessageBox.information(self, "Logged Out", "Not currently logged in to Spotify.")
             return
         
@@ -1905,50 +2628,105 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             # Clean up any existing server resources first
             self.spotify_auth.cleanup_auth_resources()
             
-            # Clear tokens and state
-            self.spotify_auth.access_token = None
-            self.spotify_auth.refresh_token = None
+            # Clear tokens and state; refreshes still in flight are discarded
+            with self._token_commit_lock:
+                self._logout_generation += 1
+                self.spotify_auth.access_token = None
+                self.spotify_auth.refresh_token = None
+                self._token_fastcache = (None, 0)
             self.spotify_auth.auth_code = None
             self.spotify_auth.code_verifier = None
             
-            # Remove saved tokens file
+            # Forget the loaded token file and move it aside in the background
+            self._spotify_tokens_mtime = None
+            self.token_refresh_timer.stop()
             tokens_path = self.get_user_data_path('spotify_tokens.json')
-            if os.path.exists(tokens_path):
-                try:
-                    # Create a backup before removing
-                    backup_path = f"{tokens_path}.bak"
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
-                    os.rename(tokens_path, backup_path)
-                    logging.info(f"Created token backup at {backup_path}")
-                except Exception as e:
-                    logging.warning(f"Failed to create token backup: {e}")
-                    
-                    # Try direct removal if backup fails
-                    try:
-                        os.remove(tokens_path)
-                    except Exception as e2:
-                        logging.error(f"Failed to remove token file: {e2}")
-            
-            # Update UI - removed self.update_spotify_auth_status()
-            QMessageBox.information(self, "Logged Out", "Successfully logged out from Spotify.")
+            self.token_backup_worker = Worker(backup_tokens_file, tokens_path)
+            self.token_backup_worker.finished.connect(self.on_spotify_logout_finished)
+            self.token_backup_worker.start()
             
         except Exception as e:
             logging.error(f"Error during Spotify logout: {e}")
             QMessageBox.warning(self, "Logout Issue", 
                             f"There was an issue during logout: {e}\n\nYou may need to restart the application.")
 
+    def schedule_token_refresh(self):
+        """Arm the background refresh to run shortly before the access token expires."""
+        if not self.spotify_auth.refresh_token:
+            self.token_refresh_timer.stop()
+            return
+        delay = self.spotify_auth.token_expiry - time.time() - self.TOKEN_REFRESH_MARGIN
+        self.token_refresh_timer.start(max(0, int(delay * 1000)))
+
+    def refresh_tokens_in_background(self):
+        """Refresh the access token on a worker thread, unless a call already did."""
+        if self.spotify_auth.token_expiry - time.time() > self.TOKEN_REFRESH_MARGIN:
+            # Refreshed lazily by an API call since the timer was armed
+            self.schedule_token_refresh()
+            return
+        if self.token_refresh_worker is not None and self.token_refresh_worker.isRunning():
+            return
+        self.token_refresh_worker = Worker(self.refresh_and_save_tokens, self._logout_generation)
+        self.token_refresh_worker.finished.connect(self.on_tokens_refreshed)
+        self.token_refresh_worker.start()
+
+    def refresh_and_save_tokens(self, generation=None):
+        """
+        Refresh the access token and save it as one step. Safe to call from any thread.
+
+        Args:
+            generation (int, optional): _logout_generation when the refresh was
+                requested; nothing is committed if the user has logged out since
+
+        Returns:
+            bool: True if a fresh access token is now available
+        """
+        if generation is None:
+            generation = self._logout_generation
+        seen_token = self.spotify_auth.access_token
+        with self._token_lock:
+            auth = self.spotify_auth
+            if auth.access_token and auth.access_token != seen_token:
+                return True  # Another thread refreshed while this one waited
+            if generation != self._logout_generation or not auth.refresh_token:
+                return False
+            tokens = auth.request_token_refresh()
+            if tokens is None:
+                return False
+            with self._token_commit_lock:
+                if generation != self._logout_generation:
+                    logging.info("Discarding a token refresh that finished after logout")
+                    return False
+                auth.apply_refreshed_tokens(tokens)
+                auth.save_tokens(self.get_user_data_path('spotify_tokens.json'))
+                self._token_fastcache = (auth.access_token, auth.token_expiry)
+        return True
+
+    def on_tokens_refreshed(self, success):
+        if success:
+            logging.info("Access token refreshed in the background")
+            self._token_refresh_retry = self.TOKEN_REFRESH_RETRY_MIN
+            self.schedule_token_refresh()
+        elif self.spotify_auth.refresh_token:
+            # Try again later, backing off while the failures continue
+            logging.warning(f"Background token refresh failed; retrying in {self._token_refresh_retry} seconds")
+            self.token_refresh_timer.start(self._token_refresh_retry * 1000)
+            self._token_refresh_retry = min(self._token_refresh_retry * 2, self.TOKEN_REFRESH_RETRY_MAX)
+
+    def on_spotify_logout_finished(self, _result):
+        """Confirm the logout once the saved tokens have been moved aside."""
+        QMessageBox.information(self, "Logged Out", "Successfully logged out from Spotify.")
+
     def load_spotify_tokens(self):
         """Load saved Spotify tokens on startup"""
         tokens_path = self.get_user_data_path('spotify_tokens.json')
         
         if os.path.exists(tokens_path):
-            # Use the same client ID as in login_to_spotify
-            default_client_id = "2241ba6e592a4d60aa18c81a8507f0b3"
-            
-            if not hasattr(self, 'spotify_auth'):
-                from spotify_auth import SpotifyAuth
-                self.spotify_auth = SpotifyAuth(default_client_id)
+            # The file was already parsed and hasn't changed since; reuse that result
+            tokens_mtime = os.stat(tokens_path).st_mtime_ns
+            if tokens_mtime == self._spotify_tokens_mtime:
+                return bool(self.spotify_auth.access_token)
+            self._spotify_tokens_mtime = tokens_mtime
             
             if self.spotify_auth.load_tokens(tokens_path):
                 # Removed self.update_spotify_auth_status()
@@ -1959,9 +2737,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         config_path = resource_path('config.json')
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as file:
-                    config = json.load(file)
-                return config.get(section_name, {})
+                return load_json_cached(config_path).get(section_name, {})
             else:
                 return {}
         except json.JSONDecodeError as e:
@@ -1972,15 +2748,13 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         config_path = resource_path('config.json')
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as file:
-                    config = json.load(file)
+                config = load_json_cached(config_path)
             else:
                 config = {}
 
             config[section_name] = data
 
-            with open(config_path, 'w') as file:
-                json.dump(config, file, indent=4)
+            write_json_cached(config_path, config)
             logging.info(f"{section_name.capitalize()} settings saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save {section_name} settings: {e}")
@@ -2049,20 +2823,10 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             old_player = self.preferred_music_player
             self.preferred_music_player = new_player
             
-            # Update links if player has changed
+            # Album links are built from the model when opened, so a player
+            # change applies to every row without touching the table
             if old_player != new_player and has_albums:
-                try:
-                    status_bar = self.statusBar()
-                    if status_bar:
-                        status_bar.showMessage(f"Updating album links for {new_player}...", 2000)
-                    else:
-                        logging.info(f"Updating album links for {new_player}...")
-                    self.update_album_links()
-                except Exception as e:
-                    logging.error(f"Error updating album links: {e}")
-                    QMessageBox.warning(self, "Warning", 
-                                    f"Settings saved, but there was an error updating album links: {e}")
-                    return
+                logging.info(f"Album links now open in {new_player}")
                 
             QMessageBox.information(self, "Success", "Application settings saved successfully.")
             
@@ -2070,143 +2834,73 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             logging.error(f"Failed to save application settings: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save application settings. Details: {e}")
 
-    def update_album_links(self):
+    def get_access_token(self):
         """
-        Update album data without displaying hyperlinks.
-        Album opening is handled by the context menu instead.
+        Get a valid Spotify access token. The last validated token is returned
+        directly until it comes within five minutes of expiring.
         """
-        # Use model for row count
-        total_rows = self.album_model.rowCount()
-        if total_rows == 0:
-            return
-            
-        # Create progress dialog for large updates
-        if total_rows > 50:
-            progress = QProgressDialog("Updating album data...", "Cancel", 0, total_rows, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.show()
-        else:
-            progress = None
-        
-        update_count = 0
-        
-        # Loop through all rows and update album data
-        for row in range(total_rows):
-            # Update progress
-            if progress and row % 5 == 0:  # Update every 5 rows
-                progress.setValue(row)
-                if progress.wasCanceled():
-                    break
-            
-            try:
-                # Get the data from the model
-                artist_name = self.album_model.data(self.album_model.index(row, AlbumModel.ARTIST), 
-                                                Qt.ItemDataRole.DisplayRole)
-                album_name = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), 
-                                                Qt.ItemDataRole.DisplayRole)
-                album_id = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), 
-                                            Qt.ItemDataRole.UserRole)
-                
-                # Get the appropriate URL based on preferred player (but don't display it)
-                if artist_name and album_name:
-                    album_url = self.get_album_url(album_id, artist_name, album_name)
-                    if album_url:
-                        # Find the index for the album column
-                        index = self.album_model.index(row, AlbumModel.ALBUM)
-                        
-                        # Get or create a widget for this cell - as plain text, not a hyperlink
-                        widget = self.album_table.indexWidget(index)
-                        
-                        if isinstance(widget, QLabel):
-                            # Update existing label to plain text
-                            widget.setText(str(album_name))  # Convert to string, no hyperlink formatting
-                            
-                            # Keep the metadata for use by context menu
-                            widget.setProperty("album_name", album_name)
-                            widget.setProperty("album_id", album_id)
-                            widget.setProperty("album_url", album_url)  # Store the URL for context menu use
-                            widget.setProperty("artist_name", artist_name)
-                            update_count += 1
-                        else:
-                            # Create a new label with plain text
-                            label = QLabel(str(album_name))  # Convert QVariant to string for QLabel
-                            
-                            # Style to match other text in the table
-                            label.setStyleSheet("color: white; background: transparent;")
-                            label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-                            
-                            # Store metadata for use by context menu
-                            label.setProperty("album_name", album_name)
-                            label.setProperty("album_id", album_id)
-                            label.setProperty("album_url", album_url)  # Store the URL for context menu use
-                            label.setProperty("artist_name", artist_name)
-                            
-                            # Use setIndexWidget to place the label in the cell
-                            self.album_table.setIndexWidget(index, label)
-                            update_count += 1
-            except Exception as e:
-                logging.error(f"Error updating album data at row {row}: {e}")
-        
-        # Close progress if shown
-        if progress:
-            progress.setValue(total_rows)
-        
-        logging.info(f"Updated {update_count} album entries")
+        token = self.cached_access_token()
+        if token:
+            return token
+
+        token = self.resolve_access_token()
+        if token:
+            self._token_fastcache = (token, getattr(self.spotify_auth, 'token_expiry', 0))
+        return token
+
+    def cached_access_token(self):
+        """Return the last validated access token while it's fresh, else None. Never blocks."""
+        token, expiry = self._token_fastcache
+        if token and token == self.spotify_auth.access_token and time.time() < expiry - 300:
+            return token
+        return None
 
-    def get_access_token(self):
+    def resolve_access_token(self):
         """Get a valid Spotify access token with proper expiration checking"""
         logging.info("Attempting to get access token")
         
-        # Log if we have a spotify_auth instance
-        has_spotify_auth = hasattr(self, 'spotify_auth')
-        logging.info(f"Has spotify_auth instance: {has_spotify_auth}")
-        
-        if hasattr(self, 'spotify_auth'):
-            has_access_token = hasattr(self.spotify_auth, 'access_token') and self.spotify_auth.access_token
-            logging.info(f"spotify_auth has access_token: {has_access_token}")
-            
-            if self.spotify_auth.access_token:
-                # Check if token is expired or about to expire (within 5 minutes)
-                current_time = int(time.time())
-                token_expiry = getattr(self.spotify_auth, 'token_expiry', 0)
-                time_to_expiry = token_expiry - current_time
-                
-                logging.info(f"Current time: {current_time}")
-                logging.info(f"Token expiry: {token_expiry}")
-                logging.info(f"Time to expiry: {time_to_expiry} seconds")
-                
-                # Preemptively refresh token if it's about to expire
-                if time_to_expiry < 300:  # Less than 5 minutes to expiry
-                    logging.info(f"Token expires in {time_to_expiry} seconds, refreshing")
-                    if self.spotify_auth.refresh_token:
-                        refresh_success = self.spotify_auth.refresh_access_token()
-                        logging.info(f"Token refresh result: {refresh_success}")
-                        if refresh_success:
-                            tokens_path = self.get_user_data_path('spotify_tokens.json')
-                            save_success = self.spotify_auth.save_tokens(tokens_path)
-                            logging.info(f"Token save result: {save_success}")
-                            return self.spotify_auth.access_token
-                    else:
-                        logging.warning("No refresh token available")
+        has_access_token = bool(self.spotify_auth.access_token)
+        logging.info(f"spotify_auth has access_token: {has_access_token}")
+        
+        if self.spotify_auth.access_token:
+            # Check if token is expired or about to expire (within 5 minutes)
+            current_time = int(time.time())
+            token_expiry = getattr(self.spotify_auth, 'token_expiry', 0)
+            time_to_expiry = token_expiry - current_time
+            
+            logging.info(f"Current time: {current_time}")
+            logging.info(f"Token expiry: {token_expiry}")
+            logging.info(f"Time to expiry: {time_to_expiry} seconds")
+            
+            # Preemptively refresh token if it's about to expire
+            if time_to_expiry < 300:  # Less than 5 minutes to expiry
+                logging.info(f"Token expires in {time_to_expiry} seconds, refreshing")
+                if self.spotify_auth.refresh_token:
+                    refresh_success = self.refresh_and_save_tokens()
+                    logging.info(f"Token refresh result: {refresh_success}")
+                    if refresh_success:
+                        return self.spotify_auth.access_token
                 else:
-                    # Token is still valid
-                    return self.spotify_auth.access_token
+                    logging.warning("No refresh token available")
+            else:
+                # Token is still valid
+                return self.spotify_auth.access_token
         
         # Try loading saved tokens
-        if not hasattr(self, 'spotify_auth') or not self.spotify_auth.access_token:
+        if not self.spotify_auth.access_token:
             logging.info("Attempting to load saved tokens")
-            token_load_success = self.load_spotify_tokens()
+            # Loading may refresh an expired token, so keep other refreshes out
+            with self._token_lock:
+                token_load_success = self.load_spotify_tokens()
             logging.info(f"Token load result: {token_load_success}")
                 
-        if hasattr(self, 'spotify_auth') and self.spotify_auth.access_token:
+        if self.spotify_auth.access_token:
             return self.spotify_auth.access_token
         
         # Try refreshing if we have a refresh token
-        if hasattr(self, 'spotify_auth') and self.spotify_auth.refresh_token:
+        if self.spotify_auth.refresh_token:
             logging.info("Attempting to refresh access token")
-            if self.spotify_auth.refresh_access_token():
-                tokens_path = self.get_user_data_path('spotify_tokens.json')
-                self.spotify_auth.save_tokens(tokens_path)
+            if self.refresh_and_save_tokens():
                 return self.spotify_auth.access_token
             else:
                 logging.warning("Failed to refresh token, clearing invalid refresh token")
@@ -2254,9 +2948,9 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         }
         try:
             logging.info(f"Searching for artist: {artist_name}")
-            response = requests.get(url, headers=headers, params=params)
+            response = self.spotify_session.get(url, headers=headers, params=params)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 # Specific 403 error handling
@@ -2282,17 +2976,14 @@ class SpotifyAlbumAnalyzer(QMainWindow):
                     # Force token refresh and retry
                     if hasattr(self, 'spotify_auth') and self.spotify_auth.refresh_token:
                         logging.info("Attempting forced token refresh after 403")
-                        if self.spotify_auth.refresh_access_token():
-                            tokens_path = self.get_user_data_path('spotify_tokens.json')
-                            self.spotify_auth.save_tokens(tokens_path)
-                            
+                        if self.refresh_and_save_tokens():
                             # Retry with new token
                             new_access_token = self.spotify_auth.access_token
                             new_headers = {"Authorization": f"Bearer {new_access_token}"}
-                            retry_response = requests.get(url, headers=new_headers, params=params)
+                            retry_response = self.spotify_session.get(url, headers=new_headers, params=params)
                             if retry_response.status_code == 200:
                                 logging.info("Retry with new token successful!")
-                                return retry_response.json()
+                                return json_loads(retry_response.content)
                 
             logging.error(f"Failed to search for artist {artist_name}: {e}")
             return {"error": str(e)}
@@ -2313,10 +3004,10 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         }
         try:
             logging.info(f"Fetching albums for artist ID: {artist_id}")
-            response = requests.get(url, headers=headers, params=params)
+            response = self.spotify_session.get(url, headers=headers, params=params)
             response.raise_for_status()
             logging.info(f"Albums fetched successfully for artist ID: {artist_id}")
-            return response.json()
+            return json_loads(response.content)
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to fetch albums for artist_id {artist_id}: {e}")
             return {"error": str(e)}
@@ -2330,34 +3021,55 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         self.fetch_album_details_by_id(album_id)
 
     def fetch_album_details_by_id(self, album_id: str):
-        def fetch_data():
-            access_token = self.get_access_token()
-            if not access_token:
-                logging.error("Failed to obtain access token")
-                return {"error": "Failed to obtain access token"}
-            
-            url = f"https://api.spotify.com/v1/albums/{album_id}"
-            headers = {"Authorization": f"Bearer {access_token}"}
-            try:
-                logging.info(f"Fetching details for album ID: {album_id}")
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
-                logging.info(f"Details fetched successfully for album ID: {album_id}")
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Failed to fetch album details for album_id {album_id}: {e}")
-                return {"error": str(e)}
+        self.start_album_details_worker(album_id=album_id)
 
+    def start_album_details_worker(self, album_id=None, track_id=None):
+        """Fetch an album's details in the background, by album ID or by one of its tracks."""
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
 
         if self.album_details_worker is None or not self.album_details_worker.isRunning():
-            self.album_details_worker = Worker(fetch_data)
+            self.album_details_worker = Worker(self.fetch_album_data, album_id, track_id)
             self.album_details_worker.finished.connect(self.on_album_details_fetched)
             self.album_details_worker.start()
         else:
             logging.warning("A request is already in progress.")
 
-    def format_date_dd_mm_yyyy(self, date_str):
+    def fetch_album_data(self, album_id=None, track_id=None):
+        """
+        Return the Spotify album JSON for album_id, resolving it from track_id first
+        when given. Runs on a worker thread; failures are returned as {"error": ...}.
+        """
+        access_token = self.get_access_token()
+        if not access_token:
+            logging.error("Failed to obtain access token")
+            return {"error": "Failed to obtain access token"}
+
+        headers = {"Authorization": f"Bearer {access_token}"}
+        try:
+            if track_id:
+                # Fetch the track's details to get the associated album ID
+                response = self.spotify_session.get(f"https://api.spotify.com/v1/tracks/{track_id}", headers=headers)
+                response.raise_for_status()
+                album_id = json_loads(response.content)['album']['id']
+
+            url = f"https://api.spotify.com/v1/albums/{album_id}"
+            logging.info(f"Fetching details for album ID: {album_id}")
+            response = self.spotify_session.get(url, headers=headers)
+            response.raise_for_status()
+            logging.info(f"Details fetched successfully for album ID: {album_id}")
+            album = json_loads(response.content)
+            if album.get('images'):
+                # Download the cover while the GUI thread checks the album
+                album['cover_future'] = self.cover_executor.submit(
+                    self._process_album_image, album['images'][0]['url'])
+            return album
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to fetch album details for album_id {album_id} (track {track_id}): {e}")
+            return {"error": str(e)}
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_date_dd_mm_yyyy(date_str):
         """Convert a date string from YYYY-MM-DD to DD-MM-YYYY format."""
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
@@ -2369,15 +3081,14 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         """Called when the album model data changes"""
         # Update main window's dataChanged flag
         self.dataChanged = self.album_model.is_modified
-        self.update_window_title()
+        self.title_timer.start()
         
         # Log the change if we have a valid index
         if topLeft.isValid():
             row = topLeft.row()
             column = topLeft.column()
             column_name = self.album_model.COLUMN_NAMES[column]
-            artist = self.album_model.data(self.album_model.index(row, AlbumModel.ARTIST), Qt.ItemDataRole.DisplayRole)
-            album = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), Qt.ItemDataRole.DisplayRole)
+            artist, album, _ = self.album_model.row_snapshot(row)
             new_value = self.album_model.data(topLeft, Qt.ItemDataRole.DisplayRole)
             
             logging.info(f"Data changed in row {row}, column '{column_name}': '{artist}' - '{album}' set '{column_name}' to '{new_value}'")
@@ -2400,99 +3111,114 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         # Convert release date to DD-MM-YYYY format
         release_date_formatted = self.format_date_dd_mm_yyyy(release_date)
 
-        # Check if the album is already in the list
-        is_album_in_list = False
-        for row in range(self.album_model.rowCount()):
-            existing_album = self.album_model.data(
-                self.album_model.index(row, AlbumModel.ALBUM), 
-                Qt.ItemDataRole.DisplayRole
-            )
-            if existing_album == album_name:
-                is_album_in_list = True
-                break
+        # Check if the album is already in the list or is being added
+        is_album_in_list = (album_name in self.album_model.album_names
+                            or album_name in self.pending_album_names)
 
+        cover_future = result.get('cover_future')
         if is_album_in_list:
+            if cover_future is not None:
+                cover_future.cancel()
             QMessageBox.information(self, "Album Already Added", f"The album '{album_name}' is already in the list.")
             return
 
-        # Download and resize album cover image
-        if result['images']:
-            image_url = result['images'][0]['url']
-            response = requests.get(image_url)
-            if response.status_code == 200:
-                image_data = response.content
-
-                # Resize the image before encoding
-                image = Image.open(BytesIO(image_data))
-                image.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                buffered = BytesIO()
-                image.save(buffered, format="PNG")
-                image_bytes = buffered.getvalue()
-                base64_image = base64.b64encode(image_bytes).decode('utf-8')
-
-                # Create album data dictionary with empty genre values
-                album_data = {
-                    "artist": artist_name,
-                    "album": album_name,
-                    "album_id": album_id,
-                    "release_date": release_date_formatted,
-                    "cover_image": base64_image,
-                    "cover_image_format": "PNG",
-                    "country": "Country",
-                    "genre_1": "",  # Changed from "Genre 1" to empty string
-                    "genre_2": "",  # Changed from "Genre 2" to empty string
-                    "comments": "Comment",
-                    "rank": self.album_model.rowCount() + 1,
-                    "points": 1
-                }
+        # Add the album once its cover has been processed, reserving its name
+        # so the same album can't be added again in the meantime
+        if cover_future is not None:
+            self.pending_album_names.add(album_name)
+            album_data = {
+                "artist": artist_name,
+                "album": album_name,
+                "album_id": album_id,
+                "release_date": release_date_formatted,
+            }
+            cover_future.add_done_callback(partial(self._emit_album_ready, album_data))
 
-                # Add the album to the model
-                self.album_model.add_album(album_data)
-                
-                # Set the row height for the new row
-                row_index = self.album_model.rowCount() - 1
-                self.album_table.setRowHeight(row_index, 100)
-                
-                # Get the album cell index
-                album_index = self.album_model.index(row_index, AlbumModel.ALBUM)
-                
-                # Create a label for the album title (as plain text, not a link)
-                album_label = QLabel(album_name)
-                album_label.setStyleSheet("color: white; background: transparent;")
-                album_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-                
-                # Store metadata for context menu use
-                album_label.setProperty("album_name", album_name)
-                album_label.setProperty("album_id", album_id)
-                album_label.setProperty("artist_name", artist_name)
-                album_label.setProperty("album_url", self.get_album_url(album_id, artist_name, album_name))
-                
-                # Set the label as the widget for the album cell
-                self.album_table.setIndexWidget(album_index, album_label)
-                
-                # Update the changed flags
-                self.dataChanged = self.album_model.is_modified
-                self.update_window_title()
+    def _process_album_image(self, image_url):
+        """
+        Download, resize and encode an album cover. Runs on cover_executor;
+        returns the base64 JPEG, or None if the download failed.
+        """
+        from io import BytesIO
+        from PIL import Image  # Imported on first use to keep startup light
+        with self.spotify_session.get(image_url, stream=True) as response:
+            if response.status_code != 200:
+                return None
+            # Decode straight from the response stream
+            response.raw.decode_content = True
+            image = Image.open(response.raw)
+            # Let JPEGs decode at a reduced scale instead of full size
+            image.draft("RGB", (400, 400))
+            image.load()
+
+        # Resize the image before encoding
+        image.thumbnail((200, 200), Image.Resampling.LANCZOS)
+        buffered = BytesIO()
+        # JPEG is several times smaller than PNG for photographic cover art
+        image.convert("RGB").save(buffered, format="JPEG", quality=85, optimize=True)
+        return base64.b64encode(buffered.getvalue()).decode('utf-8')
+
+    def _emit_album_ready(self, album_data, cover_future):
+        """Hand a finished cover back to the GUI thread through album_ready_signal."""
+        try:
+            base64_image = cover_future.result()
+        except Exception as e:
+            logging.error(f"Failed to process the album cover image: {e}")
+            base64_image = None
+        if base64_image is None:
+            album_data = {"error": "Failed to download the album cover image.", "album": album_data["album"]}
+        else:
+            album_data["cover_image"] = base64_image
+            album_data["cover_image_format"] = "JPEG"
+        self.album_ready_signal.emit(album_data)
+
+    def _on_album_ready(self, album_data):
+        """Add an album whose cover has been processed by _process_album_image."""
+        self.pending_album_names.discard(album_data["album"])
+        if "error" in album_data:
+            logging.error(album_data["error"])
+            return
 
-                # Show the notification
-                self.show_notification(f"Added album '{album_name}'")
-            else:
-                logging.error("Failed to download the album cover image.")
+        # Fill in the remaining fields with empty genre values
+        album_data.update({
+            "country": "Country",
+            "genre_1": "",  # Changed from "Genre 1" to empty string
+            "genre_2": "",  # Changed from "Genre 2" to empty string
+            "comments": "Comment",
+            "rank": self.album_model.rowCount() + 1,
+            "points": 1
+        })
+
+        # Add the album to the model
+        self.album_model.add_album(album_data)
+
+        # Set the row height for the new row
+        row_index = self.album_model.rowCount() - 1
+        self.album_table.setRowHeight(row_index, 100)
+
+        # Update the changed flags
+        self.dataChanged = self.album_model.is_modified
+        self.update_window_title()
+
+        # Show the notification
+        self.show_notification(f"Added album '{album_data['album']}'")
 
     def process_spotify_uri(self, uri: str):
         logging.info(f"Processing Spotify URI: {uri}")
         # Check if it's a valid Spotify URI for a track or an album
-        if "open.spotify.com/track/" in uri:
-            track_id = uri.split("track/")[1].split("?")[0]  # Extract the track ID
-            logging.info(f"Detected track URI. Track ID: {track_id}")
-            self.add_album_from_track(track_id)
-        elif "open.spotify.com/album/" in uri:
-            album_id = uri.split("album/")[1].split("?")[0]  # Extract the album ID
-            logging.info(f"Detected album URI. Album ID: {album_id}")
-            self.fetch_album_details_by_id(album_id)
-        else:
+        match = SPOTIFY_URI_RE.search(uri)
+        if match is None:
             logging.warning(f"Unsupported Spotify URI: {uri}")
             QMessageBox.warning(self, "Unsupported URI", "The Spotify URI is not supported.")
+            return
+
+        kind, spotify_id = match.groups()
+        if kind == "track":
+            logging.info(f"Detected track URI. Track ID: {spotify_id}")
+            self.add_album_from_track(spotify_id)
+        else:
+            logging.info(f"Detected album URI. Album ID: {spotify_id}")
+            self.fetch_album_details_by_id(spotify_id)
 
     def get_album_url(self, album_id, artist_name, album_name):
         """
@@ -2503,25 +3229,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             logging.warning("Missing artist or album name for URL generation")
             return None
 
-        if self.preferred_music_player == 'Spotify':
-            if album_id:
-                return f'spotify:album:{album_id}'
-            else:
-                logging.info(f"No Spotify album ID available for '{album_name}', falling back to search")
-                search_term = urllib.parse.quote(f'{artist_name} {album_name}')
-                return f'spotify:search:{search_term}'
-        elif self.preferred_music_player == 'Tidal':
-            # Updated Tidal URL format that works more reliably
-            # Tidal search has changed - use a direct web search instead
-            combined_term = f"{artist_name} {album_name}"
-            encoded_term = urllib.parse.quote(combined_term)
-            # Use the main web search which is more stable than the specialized album search
-            return f'https://listen.tidal.com/search?q={encoded_term}'
-        else:
-            logging.warning(f"Unknown music player preference: {self.preferred_music_player}")
-            # Default to a generic web search as fallback
-            search_term = urllib.parse.quote(f'{artist_name} {album_name}')
-            return f'https://www.google.com/search?q={search_term}+album'
+        return build_album_url(self.preferred_music_player, album_id, artist_name, album_name)
 
     def open_album_url(self, url):
         """
@@ -2534,158 +3242,83 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             return
 
         logging.info(f"Opening album URL: {url}")
+
+        # Dispatch on the URL scheme
+        scheme = url.split(':', 1)[0].lower()
+        opener = getattr(self, self.URL_OPENERS.get(scheme, '_open_other_url'))
+        opener(url)
+
+    def _open_spotify_uri(self, url):
+        """Open a spotify: URI in the client, falling back to the web player."""
+        client_installed = self.is_spotify_installed()
+        logging.info(f"Is Spotify installed? {client_installed}")
         
-        # Handle Spotify URLs
-        if url.startswith('spotify:'):
-            spotify_installed = self.is_spotify_installed()
-            logging.info(f"Is Spotify installed? {spotify_installed}")
-            
-            if spotify_installed:
-                try:
-                    # Try to open with the Spotify app
-                    if sys.platform.startswith('win'):
-                        subprocess.Popen(['start', '', url], shell=True)
-                        return
-                    elif sys.platform == 'darwin':
-                        subprocess.call(['open', url])
-                        return
-                    else:
-                        subprocess.call(['xdg-open', url])
-                        return
-                except Exception as e:
-                    logging.error(f"Failed to open Spotify URI using client: {e}")
-                    # Fall through to web fallback
-            
-            # Fallback to web if app opening fails or Spotify isn't installed
+        if client_installed:
             try:
-                # Convert spotify: URI to HTTP URL
-                if url.startswith('spotify:album:'):
-                    album_id = url.replace('spotify:album:', '')
-                    web_url = f'https://open.spotify.com/album/{album_id}'
-                    logging.info(f"Falling back to web URL: {web_url}")
-                    QDesktopServices.openUrl(QUrl(web_url))
-                    return
-                elif url.startswith('spotify:search:'):
-                    search_term = url.replace('spotify:search:', '')
-                    web_url = f'https://open.spotify.com/search/{search_term}'
-                    logging.info(f"Falling back to web URL: {web_url}")
-                    QDesktopServices.openUrl(QUrl(web_url))
-                    return
-            except Exception as e:
-                logging.error(f"Failed to open Spotify web URL: {e}")
-                QMessageBox.warning(self, "Error", f"Failed to open album in Spotify: {e}")
-        else:
-            # Handle web URLs (Tidal, etc.)
-            try:
-                # For URLs that start with https://, use QDesktopServices
-                if url.startswith('http://') or url.startswith('https://'):
-                    logging.info(f"Opening web URL: {url}")
-                    success = QDesktopServices.openUrl(QUrl(url))
-                    
-                    if not success:
-                        # If openUrl returns False, use a fallback method
-                        logging.warning("QDesktopServices.openUrl failed, trying fallback")
-                        if sys.platform.startswith('win'):
-                            os.startfile(url)
-                        elif sys.platform == 'darwin':
-                            subprocess.call(['open', url])
-                        else:
-                            subprocess.call(['xdg-open', url])
+                # Try to open with the Spotify app
+                if sys.platform.startswith('win'):
+                    subprocess.Popen(['start', '', url], shell=True)
                 else:
-                    # For other URL schemes, try platform-specific methods
-                    if sys.platform.startswith('win'):
-                        os.startfile(url)
-                    elif sys.platform == 'darwin':
-                        subprocess.call(['open', url])
-                    else:
-                        subprocess.call(['xdg-open', url])
+                    launch_url(url)
+                return
             except Exception as e:
-                logging.error(f"Failed to open URL: {e}")
-                QMessageBox.warning(self, "Error", f"Failed to open album URL: {e}")
+                logging.error(f"Failed to open Spotify URI using client: {e}")
+                spotify_installed.cache_clear()  # Probe again next time
+                # Fall through to web fallback
+        
+        # Fallback to web if app opening fails or Spotify isn't installed
+        try:
+            # Convert spotify: URI to HTTP URL
+            if url.startswith('spotify:album:'):
+                album_id = url.replace('spotify:album:', '')
+                web_url = f'https://open.spotify.com/album/{album_id}'
+                logging.info(f"Falling back to web URL: {web_url}")
+                QDesktopServices.openUrl(QUrl(web_url))
+            elif url.startswith('spotify:search:'):
+                search_term = url.replace('spotify:search:', '')
+                web_url = f'https://open.spotify.com/search/{search_term}'
+                logging.info(f"Falling back to web URL: {web_url}")
+                QDesktopServices.openUrl(QUrl(web_url))
+        except Exception as e:
+            logging.error(f"Failed to open Spotify web URL: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to open album in Spotify: {e}")
+
+    def _open_web_url(self, url):
+        """Open an http(s) URL (Tidal, web searches) in the browser."""
+        try:
+            logging.info(f"Opening web URL: {url}")
+            success = QDesktopServices.openUrl(QUrl(url))
+            
+            if not success:
+                # If openUrl returns False, use a fallback method
+                logging.warning("QDesktopServices.openUrl failed, trying fallback")
+                launch_url(url)
+        except Exception as e:
+            logging.error(f"Failed to open URL: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to open album URL: {e}")
+
+    def _open_other_url(self, url):
+        """Open any other URL scheme with the platform's opener."""
+        try:
+            launch_url(url)
+        except Exception as e:
+            logging.error(f"Failed to open URL: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to open album URL: {e}")
 
     def is_spotify_installed(self):
         """
         Check if Spotify is installed on the system.
         """
-        try:
-            if sys.platform.startswith('win'):
-                # Check Windows Registry
-                import winreg
-                try:
-                    # Check both HKEY_CURRENT_USER and HKEY_LOCAL_MACHINE
-                    try:
-                        winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Spotify")
-                        return True
-                    except WindowsError:
-                        try:
-                            winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"Software\Spotify")
-                            return True
-                        except WindowsError:
-                            # Also check for Spotify.exe in common locations
-                            program_files = os.environ.get('PROGRAMFILES', 'C:\\Program Files')
-                            program_files_x86 = os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')
-                            
-                            paths_to_check = [
-                                os.path.join(program_files, 'Spotify', 'Spotify.exe'),
-                                os.path.join(program_files_x86, 'Spotify', 'Spotify.exe'),
-                                os.path.join(os.environ.get('APPDATA', ''), 'Spotify', 'Spotify.exe')
-                            ]
-                            
-                            for path in paths_to_check:
-                                if os.path.exists(path):
-                                    logging.info(f"Found Spotify at {path}")
-                                    return True
-                            
-                            return False
-                except Exception as e:
-                    logging.warning(f"Error checking Windows registry: {e}")
-                    return False
-            elif sys.platform == 'darwin':
-                # Check macOS Applications folder
-                paths = [
-                    "/Applications/Spotify.app",
-                    os.path.expanduser("~/Applications/Spotify.app")
-                ]
-                for path in paths:
-                    if os.path.exists(path):
-                        return True
-                return False
-            else:
-                # Basic check for Linux
-                try:
-                    result = subprocess.run(['which', 'spotify'], 
-                                        stdout=subprocess.PIPE, 
-                                        stderr=subprocess.PIPE)
-                    return result.returncode == 0
-                except Exception:
-                    return False
-        except Exception as e:
-            logging.warning(f"Error checking if Spotify is installed: {e}")
-            return False  # Assume not installed if check fails
+        return spotify_installed()
 
     def add_album_from_track(self, track_id: str):
-        # Fetch the track's details to get the associated album ID
-        access_token = self.get_access_token()  # Assuming you have this method
-        if not access_token:
-            print("Failed to obtain access token")
-            return
-
-        track_url = f"https://api.spotify.com/v1/tracks/{track_id}"
-        headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get(track_url, headers=headers)
-        if response.status_code == 200:
-            album_id = response.json()['album']['id']
-            self.fetch_album_details_by_id(album_id)  # Fetch and add the album details
-        else:
-            print("Failed to fetch track details")
-        self.dataChanged = True
-        self.update_window_title()
+        # The track lookup and the album fetch both run on the details worker;
+        # on_album_details_fetched adds the album and marks the list modified
+        self.start_album_details_worker(track_id=track_id)
 
     def show_context_menu(self, position):
         """Show context menu for album table with improved URL handling."""
-        context_menu = QMenu(self)
-        remove_action = context_menu.addAction("Remove Album")
-        open_album_action = context_menu.addAction("Open Album")
+        context_menu = self.album_context_menu
         
         # Make sure viewport exists before calling mapToGlobal
         viewport = self.album_table.viewport()
@@ -2695,34 +3328,23 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             # Fallback to using the table widget's mapToGlobal directly
             action = context_menu.exec(self.album_table.mapToGlobal(position))
 
-        if action == remove_action:
+        if action == self.remove_album_action:
             index = self.album_table.indexAt(position)
             if index.isValid():
                 # Get info for logging before removing
                 row = index.row()
-                artist = self.album_model.data(self.album_model.index(row, AlbumModel.ARTIST), Qt.ItemDataRole.DisplayRole)
-                album = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), Qt.ItemDataRole.DisplayRole)
+                artist, album, _ = self.album_model.row_snapshot(row)
                 logging.info(f"Removing album '{album}' by '{artist}' from row {row}")
                 
                 self.remove_album(row)
-        elif action == open_album_action:
+        elif action == self.open_album_action:
             index = self.album_table.indexAt(position)
             if index.isValid():
                 row = index.row()
                 
-                        # Try to get the URL from the widget first
-                album_widget = self.album_table.indexWidget(self.album_model.index(row, AlbumModel.ALBUM))
-                album_url = album_widget.property("album_url") if album_widget else None
-
-                if not album_url:
-                    # Fall back to constructing the URL if widget or attribute is missing
-                    album_id = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), 
-                                        Qt.ItemDataRole.UserRole)
-                    artist_name = self.album_model.data(self.album_model.index(row, AlbumModel.ARTIST), 
-                                                    Qt.ItemDataRole.DisplayRole)
-                    album_name = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), 
-                                                    Qt.ItemDataRole.DisplayRole)
-                    album_url = self.get_album_url(album_id, artist_name, album_name)
+                # Build the URL for the preferred player from the row's data
+                artist_name, album_name, album_id = self.album_model.row_snapshot(row)
+                album_url = self.get_album_url(album_id, artist_name, album_name)
                 
                 if album_url:
                     self.open_album_url(album_url)
@@ -2756,43 +3378,46 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             # The URL handling could go here if needed
             pass
 
-    def trigger_save_album_data(self):
+    def trigger_save_album_data(self, wait=False):
+        """Save to the current file, in the background unless wait is set."""
         if self.current_file_path:
             points_mapping = self.read_points_mapping(resource_path("points.json"))
             if not points_mapping:
                 QMessageBox.warning(self, "Points Mapping Issue", "points.json is missing or invalid. Default points will be used.")
-            self.save_album_data(self.current_file_path, points_mapping)
-            self.dataChanged = False
-            logging.info(f"Data saved successfully to {self.current_file_path}. dataChanged set to False.")
-            
-            status_bar = self.statusBar()
-            if status_bar:  # Check if status bar exists
-                status_bar.showMessage(f"Data saved to {self.current_file_path}.", 5000)
-            
-            # Update last opened file and recent files
-            self.update_recent_files(self.current_file_path)
-            self.save_settings()
+            self.save_album_data(self.current_file_path, points_mapping, self.on_album_data_saved, wait)
         else:
-            self.trigger_save_as_album_data()
+            self.trigger_save_as_album_data(wait)
 
-    def trigger_save_as_album_data(self):
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Album Data As", "", "JSON Files (*.json)")
+    def on_album_data_saved(self, file_path):
+        logging.info(f"Data saved successfully to {file_path}.")
+        
+        status_bar = self.statusBar()
+        if status_bar:  # Check if status bar exists
+            status_bar.showMessage(f"Data saved to {file_path}.", 5000)
+        
+        # Update last opened file and recent files
+        self.update_recent_files(file_path)
+        self.save_settings()
+
+    def trigger_save_as_album_data(self, wait=False):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Album Data As", "", "JSON Files (*.json)",
+                                                   options=FILE_DIALOG_OPTIONS)
         if file_path:
             if not file_path.lower().endswith('.json'):
                 file_path += '.json'
             points_mapping = self.read_points_mapping(resource_path("points.json"))
-            self.save_album_data(file_path, points_mapping)
             self.current_file_path = file_path
-            self.dataChanged = False
-            logging.debug(f"Data saved successfully to {file_path}. dataChanged set to False.")
-            self.update_window_title()
-            QMessageBox.information(self, "Saved", f"Data saved to {file_path}.")
-            # Update last opened file and recent files
-            self.update_recent_files(file_path)
-            self.save_settings()
+            self.save_album_data(file_path, points_mapping, self.on_album_data_saved_as, wait)
         else:
             QMessageBox.warning(self, "Save Error", "No file selected for saving.")
 
+    def on_album_data_saved_as(self, file_path):
+        logging.debug(f"Data saved successfully to {file_path}.")
+        QMessageBox.information(self, "Saved", f"Data saved to {file_path}.")
+        # Update last opened file and recent files
+        self.update_recent_files(file_path)
+        self.save_settings()
+
     def update_window_title(self):
         unsaved_indicator = "*" if self.dataChanged else ""
         if self.current_file_path:
@@ -2811,34 +3436,33 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                self.trigger_save_album_data()  # Save changes before proceeding
+                self.trigger_save_album_data(wait=True)  # Save changes before proceeding
             elif reply == QMessageBox.StandardButton.Cancel:
                 return  # Cancel the loading process
 
         # Proceed with loading the file
         if not file_path:
-            file_path, _ = QFileDialog.getOpenFileName(self, "Open Album Data", "", "JSON Files (*.json)")
+            file_path, _ = QFileDialog.getOpenFileName(self, "Open Album Data", "", "JSON Files (*.json)",
+                                                       options=FILE_DIALOG_OPTIONS)
         
         if file_path:
-            self.load_album_data(file_path)
-            self.current_file_path = file_path
-            self.dataChanged = False  # Reset unsaved changes flag after loading
-            logging.info(f"Album data loaded from {file_path}. dataChanged set to False.")
-            self.update_window_title()
-            QMessageBox.information(self, "Loaded", f"Data loaded from {file_path}.")
-            
-            # Update last opened file and recent files
-            self.update_recent_files(file_path)
-            self.save_settings()
+            self.load_album_data(file_path, self.on_album_data_opened)
         else:
             QMessageBox.warning(self, "Load Error", "No file selected for loading.")
             logging.warning("No file selected for loading.")
 
+    def on_album_data_opened(self, file_path):
+        logging.info(f"Album data loaded from {file_path}. dataChanged set to False.")
+        QMessageBox.information(self, "Loaded", f"Data loaded from {file_path}.")
+        
+        # Update last opened file and recent files
+        self.update_recent_files(file_path)
+        self.save_settings()
+
     def update_recent_files(self, file_path):
         if file_path in self.recent_files:
             self.recent_files.remove(file_path)
-        self.recent_files.insert(0, file_path)
-        self.recent_files = self.recent_files[:5]  # Keep only the last 5 files
+        self.recent_files.appendleft(file_path)  # The oldest file drops off the end
         self.update_recent_files_menu()
 
     @staticmethod
@@ -2857,9 +3481,9 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             return {}
 
         try:
-            with open(file_path, 'r') as file:
-                points_mapping = json.load(file)
-            logging.info("Points mapping loaded successfully.")
+            # Parsed once per session (and again only if the file changes)
+            points_mapping = load_json_cached(file_path)
+            logging.debug("Points mapping loaded successfully.")
             return points_mapping
         except json.JSONDecodeError:
             logging.error(f"Error decoding JSON from points.json at {file_path}. Using default points.")
@@ -2868,7 +3492,11 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             logging.error(f"Unexpected error reading points.json at {file_path}: {e}. Using default points.")
             return {}
 
-    def save_album_data(self, file_path, points_mapping):
+    def save_album_data(self, file_path, points_mapping, on_saved=None, wait=True):
+        """
+        Save the album list to file_path and call on_saved(file_path) once it's
+        written. Unless wait is set, the JSON encode and write run on a worker.
+        """
         # Get album data from the model
         album_data = self.album_model.get_album_data()
         
@@ -2877,138 +3505,103 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             rank = i + 1
             album["rank"] = rank
             album["points"] = points_mapping.get(str(rank), 1)
-        
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(album_data, file, indent=4)
-            logging.info(f"Album data saved to {file_path}.")
-            
-            # Reset the changed flags
-            self.album_model.is_modified = False
-            self.dataChanged = False
-            self.update_window_title()
-        except Exception as e:
-            logging.error(f"Failed to save album data to {file_path}: {e}")
-            QMessageBox.critical(self, "Save Error", f"Failed to save album data: {e}")
+
+        # Reset the changed flags up front, so edits made while a background
+        # save runs still count as unsaved
+        self.album_model.is_modified = False
+        self.dataChanged = False
+        self.update_window_title()
+
+        if wait:
+            try:
+                write_album_file(file_path, album_data)
+            except Exception as e:
+                self.on_album_save_failed(file_path, e)
+                return
+            self.on_album_file_written(on_saved, file_path)
             return
 
+        # Shallow copies give the worker a snapshot that later edits can't touch
+        snapshot = [dict(album) for album in album_data]
+        self.wait_for_worker(self.album_save_worker)
+        self.album_save_worker = Worker(write_album_file, file_path, snapshot)
+        self.album_save_worker.finished.connect(partial(self.on_album_file_written, on_saved))
+        self.album_save_worker.error.connect(partial(self.on_album_save_failed, file_path))
+        self.album_save_worker.start()
+
+    def on_album_file_written(self, on_saved, file_path):
+        logging.info(f"Album data saved to {file_path}.")
+        if on_saved is not None:
+            on_saved(file_path)
+
+    def on_album_save_failed(self, file_path, error):
+        logging.error(f"Failed to save album data to {file_path}: {error}")
+        self.album_model.is_modified = True
+        self.dataChanged = True
+        self.update_window_title()
+        QMessageBox.critical(self, "Save Error", f"Failed to save album data: {error}")
+
+    @staticmethod
+    def wait_for_worker(worker):
+        """Block until a previous file worker is done before its reference is replaced."""
+        if worker is not None and worker.isRunning():
+            worker.wait()
+
     def export_album_data_html(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export to HTML", "", "HTML Files (*.html)"
+            self, "Export to HTML", "", "HTML Files (*.html)", options=FILE_DIALOG_OPTIONS
         )
         if not file_path:
             return
 
-        column_widths = {
-            "No.": "5px",
-            "Artist": "60px",
-            "Album": "60px",
-            "Release Date": "40px",
-            "Cover": "40px",
-            "Country": "60px",
-            "Genre 1": "80px",
-            "Genre 2": "80px",
-            "Comments": "150px"
-        }
+        # The HTML is formatted and written on a worker from a snapshot of the list
+        albums = [dict(album) for album in self.album_model.album_data]
+        self.wait_for_worker(self.html_export_worker)
+        self.html_export_worker = Worker(write_albums_html, file_path, albums)
+        self.html_export_worker.finished.connect(self.on_html_exported)
+        self.html_export_worker.error.connect(self.on_html_export_failed)
+        self.html_export_worker.start()
 
-        # Build HTML
-        html_lines = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            "<meta charset='utf-8'>",
-            "<title>Exported Albums</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; }",
-            "table { border-collapse: collapse; width: 100%; table-layout: fixed; }",
-            "th, td { border: 1px solid #ccc; padding: 8px; text-align: left; word-wrap: break-word; }",
-            "th { background-color: #f2f2f2; }",
-            "td img { display: block; margin: 0 auto; }",  # Center images in cells
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>Album Export</h1>",
-            "<table>",
-            "<tr>"
-        ]
+    def on_html_exported(self, file_path):
+        QMessageBox.information(self, "Export Complete", f"Exported to {file_path}")
 
-        # Add table headers with defined widths, including "No."
-        headers = ["No.", "Artist", "Album", "Release Date", "Cover", "Country", "Genre 1", "Genre 2", "Comments"]
-        for header in headers:
-            width = column_widths.get(header, "10%")
-            html_lines.append(f"<th style='width:{width};'>{header}</th>")
-        html_lines.append("</tr>")
-
-        # Use the model's rowCount instead of the view's rowCount
-        row_count = self.album_model.rowCount()
-        
-        for row in range(row_count):
-            no = row + 1  # Row number starting at 1
-            
-            # Get data from the model instead of table items
-            artist = self.album_model.data(self.album_model.index(row, AlbumModel.ARTIST), Qt.ItemDataRole.DisplayRole) or ""
-            album = self.album_model.data(self.album_model.index(row, AlbumModel.ALBUM), Qt.ItemDataRole.DisplayRole) or ""
-            release = self.album_model.data(self.album_model.index(row, AlbumModel.RELEASE_DATE), Qt.ItemDataRole.DisplayRole) or ""
-            country = self.album_model.data(self.album_model.index(row, AlbumModel.COUNTRY), Qt.ItemDataRole.DisplayRole) or ""
-            genre1 = self.album_model.data(self.album_model.index(row, AlbumModel.GENRE_1), Qt.ItemDataRole.DisplayRole) or ""
-            genre2 = self.album_model.data(self.album_model.index(row, AlbumModel.GENRE_2), Qt.ItemDataRole.DisplayRole) or ""
-            comments = self.album_model.data(self.album_model.index(row, AlbumModel.COMMENTS), Qt.ItemDataRole.DisplayRole) or ""
-
-            # Get image from the model
-            base64_image = self.album_model.data(self.album_model.index(row, AlbumModel.COVER_IMAGE), Qt.ItemDataRole.UserRole)
-            if base64_image:
-                img_tag = f'<img src="data:image/png;base64,{base64_image}" width="100" />'
-            else:
-                img_tag = ""
-
-            html_lines.append("<tr>")
-            html_lines.append(f"<td>{no}</td>")
-            html_lines.append(f"<td>{artist}</td>")
-            html_lines.append(f"<td>{album}</td>")
-            html_lines.append(f"<td>{release}</td>")
-            html_lines.append(f"<td>{img_tag}</td>")
-            html_lines.append(f"<td>{country}</td>")
-            html_lines.append(f"<td>{genre1}</td>")
-            html_lines.append(f"<td>{genre2}</td>")
-            html_lines.append(f"<td>{comments}</td>")
-            html_lines.append("</tr>")
-
-        html_lines.append("</table>")
-        html_lines.append("</body></html>")
+    def on_html_export_failed(self, error):
+        logging.error(f"Failed to export to HTML: {error}")
+        QMessageBox.critical(self, "Export Failed", f"Failed to export to HTML: {error}")
 
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(html_lines))
-            QMessageBox.information(self, "Export Complete", f"Exported to {file_path}")
-        except Exception as e:
-            logging.error(f"Failed to export to HTML: {e}")
-            QMessageBox.critical(self, "Export Failed", f"Failed to export to HTML: {e}")
-
-    def load_album_data(self, file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                album_data = json.load(file)
-        except json.JSONDecodeError as e:
-            logging.error(f"Error decoding JSON from {file_path}: {e}")
-            QMessageBox.critical(self, "Load Error", f"Failed to decode JSON from {file_path}.")
-            return
-        except Exception as e:
-            logging.error(f"Unexpected error loading {file_path}: {e}")
-            QMessageBox.critical(self, "Load Error", f"An unexpected error occurred: {e}")
-            return
+    def load_album_data(self, file_path, on_loaded=None):
+        """
+        Read file_path on a worker and show it in the table, then call
+        on_loaded(file_path).
+        """
+        self.wait_for_worker(self.album_load_worker)
+        self.album_load_worker = Worker(read_album_file, file_path)
+        self.album_load_worker.finished.connect(partial(self.on_album_file_read, file_path, on_loaded))
+        self.album_load_worker.error.connect(partial(self.on_album_load_failed, file_path))
+        self.album_load_worker.start()
 
+    def on_album_file_read(self, file_path, on_loaded, album_data):
         # Load data into the model instead of using setRowCount
         self.album_model.set_album_data(album_data)
-        
-        # Set row heights for cover images
-        for row in range(self.album_model.rowCount()):
-            self.album_table.setRowHeight(row, 100)
+        # Rows take the vertical header's fixed 100 px default section size,
+        # so the reset needs no per-row setRowHeight calls
         
         # Set the current file path and reset changed flag
         self.current_file_path = file_path
         self.dataChanged = False
         self.update_window_title()
 
+        if on_loaded is not None:
+            on_loaded(file_path)
+
+    def on_album_load_failed(self, file_path, error):
+        if isinstance(error, json.JSONDecodeError):
+            logging.error(f"Error decoding JSON from {file_path}: {error}")
+            QMessageBox.critical(self, "Load Error", f"Failed to decode JSON from {file_path}.")
+        else:
+            logging.error(f"Unexpected error loading {file_path}: {error}")
+            QMessageBox.critical(self, "Load Error", f"An unexpected error occurred: {error}")
+
     def close_album_data(self):
         if self.dataChanged:
             reply = QMessageBox.question(
@@ -3018,7 +3611,7 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                self.trigger_save_album_data()  # Save changes
+                self.trigger_save_album_data(wait=True)  # Save changes
             elif reply == QMessageBox.StandardButton.Cancel:
                 return  # Cancel the clear action
 
@@ -3037,13 +3630,17 @@ class SpotifyAlbumAnalyzer(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 logging.debug("User chose to save changes before closing.")
-                self.trigger_save_album_data()
+                self.trigger_save_album_data(wait=True)
             elif reply == QMessageBox.StandardButton.Cancel:
                 logging.debug("User canceled the close event.")
                 if a0 is not None:
                     a0.ignore()
                 return
         self.save_settings()  # Save settings on close
+        self.cover_executor.shutdown(wait=False, cancel_futures=True)
+        # Don't cut a background save or export off mid-write
+        self.wait_for_worker(self.album_save_worker)
+        self.wait_for_worker(self.html_export_worker)
         logging.debug("Closing the application. No unsaved changes or user chose not to save.")
         if a0 is not None:
             a0.accept()
@@ -3061,68 +3658,14 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         # Convert the release date to the standard format for storage
         release_date_display = release_date  # The date is already properly formatted
         
-        # Process the cover image if provided
-        base64_image = None
-        image_format = "PNG"
-        if cover_image_path:
-            try:
-                with open(cover_image_path, 'rb') as img_file:
-                    image_data = img_file.read()
-                    
-                # Determine the format based on the file extension
-                _, ext = os.path.splitext(cover_image_path)
-                ext = ext.replace('.', '').upper()  # e.g., "PNG", "WEBP", "JPG"
-                
-                # Handle JPG format - convert to JPEG for PIL
-                if ext == "JPG":
-                    ext = "JPEG"
-                    
-                # Default to PNG if unsupported
-                if ext not in ["PNG", "WEBP", "JPEG"]:
-                    logging.warning(f"Unsupported image format: {ext}, defaulting to PNG")
-                    ext = "PNG"
-                    
-                # Resize the image before encoding
-                try:
-                    image = Image.open(BytesIO(image_data))
-                    image = image.convert("RGB")  # Convert to RGB to ensure compatibility
-                    image.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                    buffered = BytesIO()
-                    image.save(buffered, format=ext)
-                    image_bytes = buffered.getvalue()
-                    base64_image = base64.b64encode(image_bytes).decode('utf-8')
-                    image_format = ext
-                    logging.info(f"Image processed successfully in {ext} format")
-                except Exception as e:
-                    logging.error(f"Failed to process image with PIL: {e}")
-                    # Fallback method if PIL processing fails
-                    try:
-                        pixmap = QPixmap(cover_image_path)
-                        if not pixmap.isNull():
-                            pixmap = pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                            byte_array = QByteArray()
-                            buffer = QBuffer(byte_array)
-                            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                            pixmap.save(buffer, "PNG")  # Always use PNG for the fallback
-                            base64_image = base64.b64encode(byte_array.data()).decode('utf-8')
-                            image_format = "PNG"
-                            logging.info("Image processed successfully using Qt fallback method")
-                        else:
-                            logging.error("Failed to create pixmap from image")
-                    except Exception as e2:
-                        logging.error(f"Failed to process image with Qt fallback: {e2}")
-            except Exception as e:
-                logging.error(f"Failed to process cover image: {e}")
-                base64_image = None
-        
-        # Create album data dictionary
+        # Create album data dictionary; the cover is filled in once processed
         album_data = {
             "artist": artist,
             "album": album,
             "album_id": "",  # No album_id for manually added albums
             "release_date": release_date_display,
-            "cover_image": base64_image,
-            "cover_image_format": image_format,
+            "cover_image": None,
+            "cover_image_format": "PNG",
             "country": country,
             "genre_1": genre1,
             "genre_2": genre2,
@@ -3138,22 +3681,10 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         row_index = self.album_model.rowCount() - 1
         self.album_table.setRowHeight(row_index, 100)
         
-        # Get the album cell index
-        album_index = self.album_model.index(row_index, AlbumModel.ALBUM)
-        
-        # Create a label for the album title
-        album_label = QLabel(album)
-        album_label.setStyleSheet("color: white; background: transparent;")
-        album_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        
-        # Store metadata for context menu use
-        album_label.setProperty("album_name", album)
-        album_label.setProperty("album_id", "")
-        album_label.setProperty("artist_name", artist)
-        album_label.setProperty("album_url", self.get_album_url("", artist, album))
-        
-        # Set the label as the widget for the album cell
-        self.album_table.setIndexWidget(album_index, album_label)
+        # Process the cover image if provided, off the GUI thread
+        if cover_image_path:
+            cover_future = self.cover_executor.submit(self._process_cover_file, cover_image_path)
+            cover_future.add_done_callback(partial(self._emit_manual_cover_ready, album_data))
         
         # Update the changed flags
         self.dataChanged = True
@@ -3161,6 +3692,76 @@ class SpotifyAlbumAnalyzer(QMainWindow):
         
         logging.info(f"Manually added album '{album}' by '{artist}' with release date '{release_date_display}'")
 
+    @staticmethod
+    def _process_cover_file(cover_image_path):
+        """
+        Read, resize and encode a local cover image. Runs on cover_executor;
+        returns (base64_image, image_format), with base64_image None on failure.
+        """
+        with open(cover_image_path, 'rb') as img_file:
+            image_data = img_file.read()
+            
+        # Determine the format based on the file extension
+        _, ext = os.path.splitext(cover_image_path)
+        ext = ext.replace('.', '').upper()  # e.g., "PNG", "WEBP", "JPG"
+        
+        # Handle JPG format - convert to JPEG for PIL
+        if ext == "JPG":
+            ext = "JPEG"
+            
+        # Default to PNG if unsupported
+        if ext not in ["PNG", "WEBP", "JPEG"]:
+            logging.warning(f"Unsupported image format: {ext}, defaulting to PNG")
+            ext = "PNG"
+            
+        # Resize the image before encoding
+        try:
+            from io import BytesIO
+            from PIL import Image
+            image = Image.open(BytesIO(image_data))
+            # Let JPEGs decode at a reduced scale instead of full size
+            image.draft("RGB", (400, 400))
+            image = image.convert("RGB")  # Convert to RGB to ensure compatibility
+            image.thumbnail((200, 200), Image.Resampling.LANCZOS)
+            buffered = BytesIO()
+            image.save(buffered, format=ext)
+            logging.info(f"Image processed successfully in {ext} format")
+            return base64.b64encode(buffered.getvalue()).decode('utf-8'), ext
+        except Exception as e:
+            logging.error(f"Failed to process image with PIL: {e}")
+            
+        # Fallback method if PIL processing fails; QImage (unlike QPixmap)
+        # is safe to use outside the GUI thread
+        image = QImage.fromData(image_data)
+        if image.isNull():
+            logging.error("Failed to create image from the cover file")
+            return None, "PNG"
+        image = image.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        byte_array = QByteArray()
+        buffer = QBuffer(byte_array)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")  # Always use PNG for the fallback
+        logging.info("Image processed successfully using Qt fallback method")
+        return base64.b64encode(byte_array.data()).decode('utf-8'), "PNG"
+
+    def _emit_manual_cover_ready(self, album_data, cover_future):
+        """Hand a processed manual cover back to the GUI thread through manual_cover_ready_signal."""
+        try:
+            base64_image, image_format = cover_future.result()
+        except Exception as e:
+            logging.error(f"Failed to process cover image: {e}")
+            return
+        if base64_image is not None:
+            self.manual_cover_ready_signal.emit(album_data, (base64_image, image_format))
+
+    def _on_manual_cover_ready(self, album_data, cover):
+        """Show a processed manual cover in its album's row."""
+        base64_image, image_format = cover
+        if self.album_model.set_cover_image(album_data, base64_image, image_format):
+            # The cover may arrive after a save, so mark the list as changed again
+            self.dataChanged = True
+            self.update_window_title()
+
 if __name__ == "__main__":
     text_edit_logger = setup_logging()
     
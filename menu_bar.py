@@ -42,6 +42,7 @@ class MenuBar:
         file_menu.addAction(close_action)
 
         self.main_window.recent_files_menu = file_menu.addMenu("Recent Files")
+        self.main_window.recent_files_menu.triggered.connect(self.main_window.on_recent_file_triggered)
         self.main_window.update_recent_files_menu()
 
         file_menu.addSeparator()
@@ -6,6 +6,7 @@ import time
 import urllib.parse
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
@@ -16,6 +17,8 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 import logging
 from PyQt6.QtCore import QObject, pyqtSignal, QMutex, QWaitCondition
 
+from json_utils import json_loads, json_dumps
+
 class SpotifyAuth(QObject):
     """
     Handles Spotify OAuth authentication flow with PKCE.
@@ -31,6 +34,7 @@ class SpotifyAuth(QObject):
         self.redirect_uri = f"http://localhost:{redirect_port}/callback"
         self.access_token = None
         self.refresh_token = None
+        self.token_expiry = 0
         self.code_verifier = None
         from typing import Optional
         self.auth_code: Optional[str] = None
@@ -38,6 +42,10 @@ class SpotifyAuth(QObject):
         self.server_thread = None
         self.socket = None
 
+        # Pooled HTTP session shared by the token exchange and refresh calls
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
         # Thread synchronization
         self.mutex = QMutex()
         self.auth_result_available = QWaitCondition()
@@ -513,7 +521,7 @@ class SpotifyAuth(QObject):
         
         try:
             # Use a longer timeout for token exchange
-            response = requests.post(token_url, data=payload, timeout=15)
+            response = self.session.post(token_url, data=payload, timeout=15)
             
             if response.status_code == 200:
                 tokens = response.json()
@@ -541,9 +549,22 @@ class SpotifyAuth(QObject):
             
     def refresh_access_token(self):
         """Refresh the access token using the refresh token."""
+        tokens = self.request_token_refresh()
+        if tokens is None:
+            return False
+        self.apply_refreshed_tokens(tokens)
+        return True
+
+    def request_token_refresh(self):
+        """
+        Exchange the refresh token for new tokens without changing any state.
+
+        Returns:
+            dict or None: The token response, or None if the refresh failed
+        """
         if not self.refresh_token:
             logging.error("No refresh token available")
-            return False
+            return None
             
         logging.info("Attempting to refresh access token...")
         logging.info(f"Refresh token (partial): {self.refresh_token[:10]}...{self.refresh_token[-10:] if len(self.refresh_token) > 20 else self.refresh_token}")
@@ -556,7 +577,7 @@ class SpotifyAuth(QObject):
         }
         
         try:
-            response = requests.post(token_url, data=payload, timeout=15)
+            response = self.session.post(token_url, data=payload, timeout=15)
             
             logging.info(f"Token refresh response status: {response.status_code}")
             logging.info(f"Token refresh response headers: {response.headers}")
@@ -565,23 +586,24 @@ class SpotifyAuth(QObject):
                 tokens = response.json()
                 logging.info("Token refresh successful")
                 logging.info(f"Response contains: {list(tokens.keys())}")
-                
-                self.access_token = tokens.get("access_token")
-                self.token_expiry = int(time.time()) + tokens.get("expires_in", 3600)
-                
-                if "refresh_token" in tokens:
-                    self.refresh_token = tokens.get("refresh_token")
-                    logging.info("New refresh token received")
-                else:
-                    logging.info("No new refresh token received, keeping existing one")
-                
-                return True
+                return tokens
             else:
                 logging.error(f"Token refresh failed: {response.status_code} - {response.text}")
-                return False
+                return None
         except Exception as e:
             logging.error(f"Exception during token refresh: {e}")
-            return False
+            return None
+
+    def apply_refreshed_tokens(self, tokens):
+        """Store the tokens returned by request_token_refresh."""
+        self.access_token = tokens.get("access_token")
+        self.token_expiry = int(time.time()) + tokens.get("expires_in", 3600)
+        
+        if "refresh_token" in tokens:
+            self.refresh_token = tokens.get("refresh_token")
+            logging.info("New refresh token received")
+        else:
+            logging.info("No new refresh token received, keeping existing one")
 
     def save_tokens(self, path):
         """
@@ -614,15 +636,15 @@ class SpotifyAuth(QObject):
         }
         
         try:
-            # Write to a temporary file first, then rename for atomic write
+            # Write to a temporary file first, then rename for atomic write.
+            # The file holds secrets, so only the owner may read it.
             temp_path = f"{path}.tmp"
-            with open(temp_path, 'w') as f:
-                json.dump(data, f)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps(data))
             
-            # Rename to target path
-            if os.path.exists(path):
-                os.remove(path)
-            os.rename(temp_path, path)
+            # Rename over the target path
+            os.replace(temp_path, path)
             
             logging.info(f"Tokens saved to {path}")
             return True
@@ -637,22 +659,23 @@ class SpotifyAuth(QObject):
             return False
             
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                raw = f.read()
+            data = json_loads(raw)
                 
             self.access_token = data.get("access_token")
             self.refresh_token = data.get("refresh_token")
             self.token_expiry = data.get("expires_at", 0)
             
-            # Enhanced logging
-            logging.info(f"Loading tokens from: {path}")
-            logging.info(f"Token file exists: {os.path.exists(path)}")
-            logging.info(f"Token file size: {os.path.getsize(path)} bytes")
-            logging.info(f"Access token loaded: {'yes' if self.access_token else 'no'}")
-            logging.info(f"Refresh token loaded: {'yes' if self.refresh_token else 'no'}")
-            
-            if self.access_token:
-                logging.info(f"Access token (partial): {self.access_token[:10]}...{self.access_token[-10:] if len(self.access_token) > 20 else self.access_token}")
+            # One record summarising what was loaded; formatted lazily
+            logging.info(
+                "Loaded tokens from %s (access token: %s, refresh token: %s)",
+                path,
+                'yes' if self.access_token else 'no',
+                'yes' if self.refresh_token else 'no'
+            )
+            if self.access_token and logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Access token (partial): {self.access_token[:10]}...{self.access_token[-10:] if len(self.access_token) > 20 else self.access_token}")
             
             # Check if tokens were loaded successfully
             if not self.access_token or not self.refresh_token:
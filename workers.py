@@ -4,15 +4,16 @@ import tempfile
 from pathlib import Path
 
 import requests
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
 
 class DownloadWorker(QObject):
     """
-    Downloads a file from GitHub, emits progress, success, or failure signals.
+    Downloads a file from GitHub, emits progress, success, failure, or cancellation signals.
     """
     progress_changed = pyqtSignal(int)
     download_finished = pyqtSignal(str)
     download_failed = pyqtSignal(str)
+    download_cancelled = pyqtSignal()
 
     def __init__(self, download_url: str, github_token: str):
         super().__init__()
@@ -20,6 +21,7 @@ class DownloadWorker(QObject):
         self.github_token = github_token
         self.is_cancelled = False
 
+    @pyqtSlot()
     def start_download(self, timeout: int = 30):
         try:
             headers = {
@@ -31,19 +33,27 @@ class DownloadWorker(QObject):
 
             total_size = int(resp.headers.get('content-length', 0))
             downloaded_size = 0
+            last_progress = -1
             chunk_size = 1024 * 256  # 256 KB chunks for performance
 
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".exe")
             with temp_file, open(temp_file.name, 'wb') as f:
                 for chunk in resp.iter_content(chunk_size=chunk_size):
                     if self.is_cancelled:
-                        os.unlink(temp_file.name)
-                        return
+                        break
                     if chunk:
                         f.write(chunk)
                         downloaded_size += len(chunk)
                         progress = int((downloaded_size / total_size) * 100) if total_size else 0
-                        self.progress_changed.emit(progress)
+                        # Only signal whole-percent changes so the GUI queue stays short
+                        if progress != last_progress:
+                            last_progress = progress
+                            self.progress_changed.emit(progress)
+            if self.is_cancelled:
+                # Remove the partial file once it has been closed
+                os.unlink(temp_file.name)
+                self.download_cancelled.emit()
+                return
             self.download_finished.emit(temp_file.name)
 
         except requests.exceptions.RequestException as e: